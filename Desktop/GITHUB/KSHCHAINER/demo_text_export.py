@@ -117,6 +117,7 @@ def create_demo_text_export():
     print(f"- Total dependencies: {len(forward_deps)}")
     
     # Clean up
+    analyzer.close()
     if os.path.exists("demo_export.db"):
         os.remove("demo_export.db")
 
@@ -9,18 +9,89 @@ Analyzes KSH/SH scripts to identify dependencies including:
 
 import re
 import os
+import sys
 import sqlite3
 import json
+import datetime
 from pathlib import Path
 from typing import Dict, List, Set, Tuple
 import logging
+import multiprocessing
+import functools
+import hashlib
+import operator
+import threading
+import weakref
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# Per-process analyzer used by the worker pool in analyze_ksh_directory
+_worker_analyzer = None
+
+def _init_worker(analyzer):
+    """Process pool initializer: keep the pickled analyzer for this worker"""
+    global _worker_analyzer
+    _worker_analyzer = analyzer
+
+def _analyze_file_worker(filepath):
+    """Process pool task: analyze one file in the worker's analyzer"""
+    return _worker_analyzer._analyze_file_safe(filepath)
+
+def _intern_text(value):
+    """sys.intern() for a nullable text column value"""
+    return value if value is None else sys.intern(value)
+
+def _close_connections(connections):
+    """Close and forget a list of (thread, connection) pairs (shared with the finalizer)"""
+    while connections:
+        connections.pop()[1].close()
 
 class KSHAnalyzer:
     """Main analyzer class for KSH script dependencies"""
     
+    # Directories with at least this many scripts are parsed in a process pool
+    parallel_threshold = 200
+    parallel_chunksize = 16
+    # Serial analysis reads this many files ahead on background threads
+    prefetch_depth = 32
+    prefetch_workers = 4
+    # Parses are stored per file and reused while its mtime and size are
+    # unchanged; bump this when parsing changes in ways the patterns do not show
+    parse_cache_version = 2
+    
+    # Lookup indexes, dropped and rebuilt around the bulk load in analyze_ksh_directory.
+    # Each leads with the looked-up column and the is_commented filter, then the
+    # ORDER BY columns, so the dependency queries read rows already in order
+    lookup_indexes = {
+        'idx_dep_src': 'dependencies(source_script, is_commented, line_number)',
+        'idx_dep_tgt': 'dependencies(target_script, is_commented, source_script, line_number)',
+        'idx_plsql_src': 'plsql_calls(source_script, is_commented, line_number)',
+        'idx_plsql_proc': 'plsql_calls(procedure_name COLLATE NOCASE)',
+    }
+    
+    # Trigram full-text index over the text the PL/SQL searches match with
+    # '%term%', kept in step with plsql_calls by triggers (rowid = plsql_calls.id)
+    # and, like the lookup indexes, rebuilt in one pass after a bulk load
+    search_index_columns = {
+        'procedure_name': 'new.procedure_name',
+        'package_name': 'new.package_name',
+        'schema_name': 'new.schema_name',
+        'full_name': "COALESCE(new.schema_name, '') || '.' || COALESCE(new.package_name, '') || '.' || new.procedure_name",
+        'context': 'new.context',
+    }
+    
     def __init__(self, db_path: str = "ksh_dependencies.db"):
         self.db_path = db_path
         self.setup_database()
+        
+        # Long-lived read connections, one per thread (see _get_connection)
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+        # Close them when the analyzer is collected or the interpreter exits,
+        # so SQLite can checkpoint and remove the -wal/-shm files
+        weakref.finalize(self, _close_connections, self._connections)
         self.setup_logging()
         
         # Regex patterns for different dependency types
@@ -38,15 +109,143 @@ class KSHAnalyzer:
             ],
             'plsql_call': [
                 r'select\s+(\w+\.\w+(?:\.\w+)*)\s*\([^)]*\)\s+from\s+dual',  # PL/SQL function call from dual
-                r'(\w+\.\w+(?:\.\w+)*)\s*\([^)]*\)',  # General PL/SQL procedure/function call (2+ parts)
+                # General PL/SQL procedure/function call (2+ parts). The lookbehind
+                # only skips mid-word starts, which can never be reported (the match
+                # at the word start always wins), instead of retrying each one
+                r'(?<!\w)(\w+\.\w+(?:\.\w+)*)\s*\([^)]*\)',
             ]
         }
         
+        self._compile_patterns()
+        
+        # In-process memo of the dependency lookups; entries are keyed by
+        # _cache_key() so writes here or by another connection invalidate them
+        self._data_generation = 0
+        self._forward_cache = functools.lru_cache(maxsize=1024)(self._query_forward_dependencies)
+        self._backward_cache = functools.lru_cache(maxsize=1024)(self._query_backward_dependencies)
+        # Search results, so retyping a term in the GUI skips the query
+        self._search_cache = functools.lru_cache(maxsize=128)(self._query_plsql_search)
+        self._enhanced_search_cache = functools.lru_cache(maxsize=128)(self._query_plsql_search_enhanced)
+        
+    def _compile_patterns(self):
+        """Compile the dependency patterns"""
+        # Compile each pattern once; the per-category union is a single-pass
+        # pre-check so lines without any possible match skip the pattern loop
+        self._compiled_patterns, self._category_filters = self._build_pattern_set(re.IGNORECASE)
+        # Same patterns with ASCII-only case folding and classes: cheaper, and
+        # identical matches on ASCII text (the usual script content) as long as
+        # it has no \x1c-\x1f, which only Unicode \s counts as whitespace
+        self._ascii_compiled_patterns, self._ascii_category_filters = \
+            self._build_pattern_set(re.IGNORECASE | re.ASCII)
+        self._unicode_only_space = re.compile('[\x1c-\x1f]')
+        # Every dependency pattern needs a '.' between a word (or '/') character
+        # and a word character, so only lines with one are parsed; leading with
+        # the literal '.' lets the regex engine skip ahead fast
+        self._line_filter = re.compile(r'\.(?<=[/\w]\.)(?=\w)')
+        # Substrings every pattern of a category needs ("sh" of .sh/.ksh, "ctl",
+        # "("), tested before the category regex. On ASCII text the line is
+        # lowercased first, which is exactly ASCII IGNORECASE folding; Unicode
+        # folding is wider, so there only the caseless "(" is used
+        self._ascii_literals = {'script_call': 'sh', 'ctl_file': 'ctl', 'plsql_call': '('}
+        self._unicode_literals = {'script_call': '', 'ctl_file': '', 'plsql_call': '('}
+        # Per-file scan state, built once and shared by every file
+        self._ascii_scanners = self._scanner_bundle(
+            self._ascii_compiled_patterns, self._ascii_category_filters, self._ascii_literals)
+        self._unicode_scanners = self._scanner_bundle(
+            self._compiled_patterns, self._category_filters, self._unicode_literals)
+    
+    def _scanner_bundle(self, compiled: Dict, filters: Dict, literals: Dict) -> tuple:
+        """(literal, filter, patterns) for scripts, CTL files and PL/SQL calls, in scan order"""
+        return tuple((literals[category], filters[category], tuple(compiled[category]))
+                     for category in ('script_call', 'ctl_file', 'plsql_call'))
+    
+    def _build_pattern_set(self, flags: int) -> Tuple[Dict, Dict]:
+        """Compile the per-category pattern lists and union filters with the given flags"""
+        compiled = {
+            category: [re.compile(pattern, flags) for pattern in patterns]
+            for category, patterns in self.patterns.items()
+        }
+        filters = {
+            category: re.compile('|'.join(f'(?:{pattern})' for pattern in patterns), flags)
+            for category, patterns in self.patterns.items()
+        }
+        return compiled, filters
+    
+    def __getstate__(self):
+        """Pickle only what parsing needs, so worker processes never touch the database"""
+        return {'db_path': self.db_path, 'patterns': self.patterns, 'logger': self.logger}
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._compile_patterns()
+        
+    def _connect(self, **kwargs) -> sqlite3.Connection:
+        """Open a connection with the per-connection performance pragmas applied"""
+        conn = sqlite3.connect(self.db_path, **kwargs)
+        # WAL (set once in setup_database) makes NORMAL sync safe: no fsync per commit
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        # Larger page cache (negative = KiB) and memory-mapped reads for lookups
+        conn.execute('PRAGMA cache_size=-262144')
+        conn.execute('PRAGMA mmap_size=268435456')
+        return conn
+        
+    def _get_connection(self) -> sqlite3.Connection:
+        """Return this thread's reused connection, opening it on first use"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # Only the owning thread queries it; close() may run from another thread
+            conn = self._connect(check_same_thread=False)
+            self._local.conn = conn
+            with self._connections_lock:
+                # Release connections left behind by finished threads (e.g. scans)
+                for entry in [e for e in self._connections if not e[0].is_alive()]:
+                    self._connections.remove(entry)
+                    entry[1].close()
+                self._connections.append((threading.current_thread(), conn))
+        return conn
+    
+    def get_connection(self) -> sqlite3.Connection:
+        """Return this thread's shared, tuned connection for ad-hoc queries (do not close it)"""
+        return self._get_connection()
+    
+    def close(self):
+        """Close the reused query connections; later queries reopen them"""
+        with self._connections_lock:
+            self._local = threading.local()
+            _close_connections(self._connections)
+    
+    def _cache_key(self) -> tuple:
+        """Identify the current database contents for the lookup caches"""
+        # With WAL, commits land in the -wal file before being checkpointed
+        key = [self._data_generation]
+        for path in (self.db_path, self.db_path + '-wal'):
+            try:
+                key.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                key.append(0)
+        return tuple(key)
+    
+    def data_version(self) -> tuple:
+        """Token that changes whenever the analyzed data may have changed, for callers' own caches"""
+        return self._cache_key()
+    
+    def _invalidate_caches(self):
+        """Drop cached lookups after this instance changes the database"""
+        self._data_generation += 1
+        self._forward_cache.cache_clear()
+        self._backward_cache.cache_clear()
+        self._search_cache.cache_clear()
+        self._enhanced_search_cache.cache_clear()
+    
     def setup_database(self):
         """Initialize SQLite database for storing dependencies"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
+        # Journal mode is persistent in the database file
+        cursor.execute('PRAGMA journal_mode=WAL')
+        
         # Create tables
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS scripts (
@@ -93,6 +292,16 @@ class KSHAnalyzer:
             )
         ''')
         
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS parse_cache (
+                filepath TEXT PRIMARY KEY,
+                mtime_ns INTEGER,
+                size INTEGER,
+                parser TEXT,
+                analysis TEXT
+            )
+        ''')
+        
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS user_settings (
                 id INTEGER PRIMARY KEY,
@@ -102,9 +311,61 @@ class KSHAnalyzer:
             )
         ''')
         
+        self._create_indexes(cursor)
+        self._search_index = self._create_search_index(cursor)
+        
         conn.commit()
         conn.close()
+    
+    def _create_search_index(self, cursor: sqlite3.Cursor) -> bool:
+        """Create the PL/SQL trigram index and its triggers; False if SQLite lacks FTS5 trigram"""
+        columns = ', '.join(self.search_index_columns)
+        values = ', '.join(self.search_index_columns.values())
         
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'plsql_calls_fts'")
+        if cursor.fetchone() is None:
+            try:
+                cursor.execute(f"CREATE VIRTUAL TABLE plsql_calls_fts USING fts5({columns}, tokenize='trigram')")
+            except sqlite3.OperationalError:
+                return False
+            # Index the calls of a database created before the index existed
+            cursor.execute(f'INSERT INTO plsql_calls_fts (rowid, {columns}) '
+                           f'SELECT id, {values.replace("new.", "")} FROM plsql_calls')
+        
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS plsql_calls_fts_insert AFTER INSERT ON plsql_calls BEGIN
+                INSERT INTO plsql_calls_fts (rowid, {columns}) VALUES (new.id, {values});
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS plsql_calls_fts_delete AFTER DELETE ON plsql_calls BEGIN
+                DELETE FROM plsql_calls_fts WHERE rowid = old.id;
+            END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS plsql_calls_fts_update AFTER UPDATE ON plsql_calls BEGIN
+                DELETE FROM plsql_calls_fts WHERE rowid = old.id;
+                INSERT INTO plsql_calls_fts (rowid, {columns}) VALUES (new.id, {values});
+            END
+        ''')
+        return True
+        
+    def _create_indexes(self, cursor: sqlite3.Cursor):
+        """Create the lookup indexes if they are missing"""
+        for name, target in self.lookup_indexes.items():
+            cursor.execute(f'CREATE INDEX IF NOT EXISTS {name} ON {target}')
+    
+    def _drop_indexes(self, cursor: sqlite3.Cursor):
+        """Drop the lookup indexes ahead of a bulk load"""
+        for name in self.lookup_indexes:
+            cursor.execute(f'DROP INDEX IF EXISTS {name}')
+    
+    def _drop_search_index(self, cursor: sqlite3.Cursor):
+        """Drop the PL/SQL trigram index and its triggers ahead of a bulk load"""
+        for trigger in ('plsql_calls_fts_insert', 'plsql_calls_fts_delete', 'plsql_calls_fts_update'):
+            cursor.execute(f'DROP TRIGGER IF EXISTS {trigger}')
+        cursor.execute('DROP TABLE IF EXISTS plsql_calls_fts')
+    
     def setup_logging(self):
         """Setup logging configuration"""
         logging.basicConfig(
@@ -119,11 +380,51 @@ class KSHAnalyzer:
         
     def is_line_commented(self, line: str) -> bool:
         """Check if a line is commented out"""
-        stripped = line.strip()
-        return stripped.startswith('#') or stripped.startswith('//')
+        # Only leading whitespace matters, and a line that does not start with
+        # whitespace (isspace() is strip()'s set) needs no stripped copy at all
+        if line[:1].isspace():
+            line = line.lstrip()
+        return line.startswith(('#', '//'))
+        
+    def _candidate_lines(self, content: str):
+        """Yield (line_num, line) only for lines where some dependency pattern can match"""
+        search = self._line_filter.search
+        content_len = len(content)
+        line_num = 1
+        line_start = 0
+        pos = 0
+        while True:
+            match = search(content, pos)
+            if match is None:
+                return
+            start = match.start()
+            begin = content.rfind('\n', 0, start) + 1
+            end = content.find('\n', start)
+            if end == -1:
+                end = content_len
+            line_num += content.count('\n', line_start, begin)
+            line_start = begin
+            yield line_num, content[begin:end]
+            if end >= content_len:
+                return
+            pos = end + 1
+        
+    def read_script(self, filepath: str) -> Tuple[str, int]:
+        """Read a script once, returning its text and line count"""
+        _, content, line_count = self._read_file_info(filepath)
+        return content, line_count
         
     def extract_dependencies_from_file(self, filepath: str) -> Dict[str, List[Tuple]]:
         """Extract all dependencies from a single KSH/SH file"""
+        try:
+            content, _ = self.read_script(filepath)
+        except Exception as e:
+            self.logger.error(f"Error processing file {filepath}: {e}")
+            return {'scripts': [], 'ctl_files': [], 'plsql_calls': []}
+        return self.extract_dependencies_from_content(filepath, content)
+        
+    def extract_dependencies_from_content(self, filepath: str, content: str) -> Dict[str, List[Tuple]]:
+        """Extract all dependencies from the already-read text of a KSH/SH file"""
         dependencies = {
             'scripts': [],
             'ctl_files': [],
@@ -131,63 +432,80 @@ class KSHAnalyzer:
         }
         
         try:
-            with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
-                
             filename = os.path.basename(filepath)
             
-            for line_num, line in enumerate(lines, 1):
-                is_commented = self.is_line_commented(line)
+            # A pass over the file picks the cheaper ASCII pattern set when it is safe
+            ascii_text = content.isascii() and not self._unicode_only_space.search(content)
+            scanners = self._ascii_scanners if ascii_text else self._unicode_scanners
+            
+            # Hoist per-line lookups out of the hot loop
+            ((script_literal, script_filter, script_patterns),
+             (ctl_literal, ctl_filter, ctl_patterns),
+             (plsql_literal, plsql_filter, plsql_patterns)) = scanners
+            script_deps = dependencies['scripts']
+            ctl_deps = dependencies['ctl_files']
+            plsql_deps = dependencies['plsql_calls']
+            normalize = self.normalize_script_name
+            
+            # Only lines with a possible match are split out of the file text
+            for line_num, line in self._candidate_lines(content):
                 line_clean = line.strip()
                 
                 # Skip empty lines
                 if not line_clean:
                     continue
+                
+                # Same test as is_line_commented, on the already-stripped line
+                is_commented = line_clean.startswith(('#', '//'))
+                
+                # Each category's literal is checked first, so most lines run
+                # only the one category regex that can actually match
+                probe = line_clean.lower() if ascii_text else line_clean
                     
                 # Extract script calls - use set to prevent duplicates per line (normalized)
-                found_scripts = set()
-                for pattern in self.patterns['script_call']:
-                    matches = re.findall(pattern, line_clean, re.IGNORECASE)
-                    for match in matches:
-                        # Normalize the script name to prevent duplicates like "./script.ksh" and "script.ksh"
-                        normalized_match = self.normalize_script_name(match)
-                        if normalized_match not in found_scripts:
-                            found_scripts.add(normalized_match)
-                            dependencies['scripts'].append((
-                                filename, match, line_num, line_clean, is_commented
-                            ))
+                if script_literal in probe and script_filter.search(line_clean):
+                    found_scripts = set()
+                    for pattern in script_patterns:
+                        for match in pattern.findall(line_clean):
+                            # Normalize the script name to prevent duplicates like "./script.ksh" and "script.ksh"
+                            normalized_match = normalize(match)
+                            if normalized_match not in found_scripts:
+                                found_scripts.add(normalized_match)
+                                script_deps.append((
+                                    filename, match, line_num, line_clean, is_commented
+                                ))
                 
                 # Extract CTL file references - use set to prevent duplicates per line
-                found_ctl_files = set()
-                for pattern in self.patterns['ctl_file']:
-                    matches = re.findall(pattern, line_clean, re.IGNORECASE)
-                    for match in matches:
-                        if match not in found_ctl_files:
-                            found_ctl_files.add(match)
-                            dependencies['ctl_files'].append((
-                                filename, match, line_num, line_clean, is_commented
-                            ))
+                if ctl_literal in probe and ctl_filter.search(line_clean):
+                    found_ctl_files = set()
+                    for pattern in ctl_patterns:
+                        for match in pattern.findall(line_clean):
+                            if match not in found_ctl_files:
+                                found_ctl_files.add(match)
+                                ctl_deps.append((
+                                    filename, match, line_num, line_clean, is_commented
+                                ))
                 
                 # Extract PL/SQL calls - use set to prevent duplicates per line
-                found_plsql_calls = set()
-                for pattern in self.patterns['plsql_call']:
-                    matches = re.findall(pattern, line_clean, re.IGNORECASE)
-                    for match in matches:
-                        if '.' in match and match not in found_plsql_calls:
-                            found_plsql_calls.add(match)
-                            parts = match.split('.')
-                            if len(parts) >= 2:
-                                if len(parts) == 2:
+                if plsql_literal in probe and plsql_filter.search(line_clean):
+                    found_plsql_calls = set()
+                    for pattern in plsql_patterns:
+                        for match in pattern.findall(line_clean):
+                            # Matches always hold at least one '.' (name.name)
+                            if match not in found_plsql_calls:
+                                found_plsql_calls.add(match)
+                                # Split at the first dots only: no list, no join
+                                head, _, tail = match.partition('.')
+                                if '.' not in tail:
                                     # Format: package.procedure
                                     schema = ''
-                                    package = parts[0]
-                                    procedure = parts[1]
+                                    package = head
+                                    procedure = tail
                                 else:
                                     # Format: schema.package.procedure (or longer)
-                                    schema = parts[0]
-                                    package = parts[1]
-                                    procedure = '.'.join(parts[2:])
-                                dependencies['plsql_calls'].append((
+                                    schema = head
+                                    package, _, procedure = tail.partition('.')
+                                plsql_deps.append((
                                     filename, match, schema, package, procedure, 
                                     line_num, line_clean, is_commented
                                 ))
@@ -199,13 +517,151 @@ class KSHAnalyzer:
     
     def scan_directory(self, directory: str, extensions: List[str]) -> List[str]:
         """Scan directory for files with specified extensions"""
+        # os.scandir entries carry their type from readdir, and endswith takes
+        # the whole suffix tuple; the order matches os.walk (a directory's
+        # files, then each subdirectory in turn, symlinked dirs not followed)
+        suffixes = tuple(extensions)
         files = []
-        for root, dirs, filenames in os.walk(directory):
-            for filename in filenames:
-                if any(filename.endswith(ext) for ext in extensions):
-                    files.append(os.path.join(root, filename))
+        pending = [directory]
+        while pending:
+            subdirs = []
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False
+                        if is_dir:
+                            if not entry.is_symlink():
+                                subdirs.append(entry.path)
+                        elif entry.name.endswith(suffixes):
+                            files.append(entry.path)
+            except OSError:
+                continue
+            pending.extend(reversed(subdirs))
         return files
     
+    def _read_file_info(self, filepath: str):
+        """Stat and read one script: (stat, content, line_count)"""
+        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+            # fstat on the open descriptor: no second path lookup for the mtime
+            stat = os.fstat(f.fileno())
+            content = f.read()
+        line_count = content.count('\n')
+        if content and not content.endswith('\n'):
+            line_count += 1
+        return stat, content, line_count
+    
+    def _build_analysis(self, filepath: str, stat, content: str, line_count: int):
+        """Build a script's scripts-table row and parse its dependencies"""
+        script_row = (
+            os.path.basename(filepath),
+            filepath,
+            'ksh' if filepath.endswith('.ksh') else 'sh',
+            line_count,
+            str(stat.st_mtime)
+        )
+        return script_row, self.extract_dependencies_from_content(filepath, content)
+    
+    def _analyze_file(self, filepath: str) -> Tuple[tuple, Dict[str, List]]:
+        """Parse one script into its scripts-table row and its dependencies"""
+        # The file is read once for both line count and parsing
+        return self._build_analysis(filepath, *self._read_file_info(filepath))
+    
+    def _analyze_file_safe(self, filepath: str):
+        """Return (analysis, None) or (None, error message) for one script"""
+        try:
+            return self._analyze_file(filepath), None
+        except Exception as e:
+            return None, str(e)
+    
+    def _iter_prefetched(self, files: List[str]):
+        """Yield (filepath, read future) with up to prefetch_depth reads in flight"""
+        with ThreadPoolExecutor(max_workers=self.prefetch_workers) as executor:
+            pending = deque()
+            for filepath in files:
+                pending.append((filepath, executor.submit(self._read_file_info, filepath)))
+                if len(pending) >= self.prefetch_depth:
+                    yield pending.popleft()
+            while pending:
+                yield pending.popleft()
+    
+    def _analyze_files(self, files: List[str]) -> List[tuple]:
+        """Analyze files in order, using a process pool for large directories"""
+        workers = os.cpu_count() or 1
+        if len(files) >= self.parallel_threshold and workers > 1:
+            try:
+                # Spawned, not forked: callers such as the GUI scan thread run
+                # alongside other threads, whose held locks a fork would copy
+                with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                         initargs=(self,),
+                                         mp_context=multiprocessing.get_context('spawn')) as executor:
+                    return list(executor.map(_analyze_file_worker, files,
+                                             chunksize=self.parallel_chunksize))
+            except (OSError, BrokenProcessPool) as e:
+                self.logger.warning(f"Process pool unavailable, analyzing serially: {e}")
+        
+        # Serial path: file reads run ahead on threads so disk waits overlap parsing
+        outcomes = []
+        for filepath, read in self._iter_prefetched(files):
+            try:
+                outcomes.append((self._build_analysis(filepath, *read.result()), None))
+            except Exception as e:
+                outcomes.append((None, str(e)))
+        return outcomes
+    
+    def _parser_key(self) -> str:
+        """Identify the parsing rules, so stored parses are only reused under the same ones"""
+        return hashlib.sha256(f"{self.parse_cache_version}:{self.patterns!r}".encode()).hexdigest()
+    
+    def _analyze_files_cached(self, files: List[str], parser: str) -> Tuple[List[tuple], List[tuple], List[str]]:
+        """Analyze files like _analyze_files, reusing stored parses of unchanged files
+        
+        Returns the outcomes in file order, the parse_cache rows to store and
+        the cached paths that were not part of this scan.
+        """
+        cursor = self._get_connection().cursor()
+        cursor.execute('SELECT filepath, mtime_ns, size, analysis FROM parse_cache WHERE parser = ?', (parser,))
+        cached = {row[0]: row[1:] for row in cursor}
+        
+        outcomes = [None] * len(files)
+        signatures = [None] * len(files)
+        changed = []
+        for index, filepath in enumerate(files):
+            try:
+                stat = os.stat(filepath)
+            except OSError:
+                # Left to the parse, which reports the error
+                changed.append(index)
+                continue
+            signatures[index] = (stat.st_mtime_ns, stat.st_size)
+            entry = cached.get(filepath)
+            if entry is not None and entry[:2] == signatures[index]:
+                try:
+                    outcomes[index] = (self._decode_analysis(entry[2]), None)
+                    continue
+                except (ValueError, TypeError, AttributeError):
+                    # Unreadable entry: parse the file again and overwrite it
+                    pass
+            changed.append(index)
+        
+        cache_rows = []
+        for index, outcome in zip(changed, self._analyze_files([files[i] for i in changed])):
+            outcomes[index] = outcome
+            # Stat'ed before the read, so a file changed meanwhile is parsed again next time
+            if outcome[1] is None and signatures[index] is not None:
+                cache_rows.append((files[index], *signatures[index], parser,
+                                   json.dumps(outcome[0], separators=(',', ':'))))
+        
+        return outcomes, cache_rows, list(cached.keys() - set(files))
+    
+    @staticmethod
+    def _decode_analysis(text: str):
+        """Rebuild a stored parse; JSON keeps the database a plain data file"""
+        script_row, deps = json.loads(text)
+        return tuple(script_row), {key: [tuple(dep) for dep in rows] for key, rows in deps.items()}
+    
     def analyze_ksh_directory(self, ksh_dir: str) -> Dict[str, any]:
         """Analyze all KSH/SH files in directory"""
         self.logger.info(f"Analyzing KSH directory: {ksh_dir}")
@@ -219,69 +675,90 @@ class KSHAnalyzer:
             'errors': []
         }
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Clear existing data
-        cursor.execute('DELETE FROM scripts')
-        cursor.execute('DELETE FROM dependencies')
-        cursor.execute('DELETE FROM plsql_calls')
-        
-        for filepath in ksh_files:
-            try:
-                # Store script info
-                stat = os.stat(filepath)
-                cursor.execute('''
-                    INSERT OR REPLACE INTO scripts 
-                    (filename, filepath, file_type, line_count, last_modified)
-                    VALUES (?, ?, ?, ?, ?)
-                ''', (
-                    os.path.basename(filepath),
-                    filepath,
-                    'ksh' if filepath.endswith('.ksh') else 'sh',
-                    sum(1 for line in open(filepath, 'r', encoding='utf-8', errors='ignore')),
-                    str(stat.st_mtime)
-                ))
-                
-                # Extract dependencies
-                deps = self.extract_dependencies_from_file(filepath)
-                results['dependencies'][os.path.basename(filepath)] = deps
-                
-                # Store script dependencies with normalized target names to prevent duplicates
-                for dep in deps['scripts']:
-                    # Always normalize the target script name before storage
-                    normalized_target = self.normalize_script_name(dep[1])
-                    
-                    # Insert the dependency with normalized target name
-                    cursor.execute('''
-                        INSERT OR IGNORE INTO dependencies 
-                        (source_script, target_script, dependency_type, line_number, context, is_commented)
-                        VALUES (?, ?, ?, ?, ?, ?)
-                    ''', (dep[0], normalized_target, 'script', dep[2], dep[3], dep[4]))
-                
-                # Store CTL file dependencies
-                for dep in deps['ctl_files']:
-                    cursor.execute('''
-                        INSERT INTO dependencies 
-                        (source_script, target_script, dependency_type, line_number, context, is_commented)
-                        VALUES (?, ?, ?, ?, ?, ?)
-                    ''', (dep[0], dep[1], 'ctl', dep[2], dep[3], dep[4]))
-                
-                # Store PL/SQL calls
-                for dep in deps['plsql_calls']:
-                    cursor.execute('''
-                        INSERT INTO plsql_calls 
-                        (source_script, procedure_name, schema_name, package_name, line_number, context, is_commented)
-                        VALUES (?, ?, ?, ?, ?, ?, ?)
-                    ''', (dep[0], dep[1], dep[2], dep[3], dep[5], dep[6], dep[7]))
-                
-            except Exception as e:
-                error_msg = f"Error processing {filepath}: {e}"
+        # Collect all rows first, then write them in one transaction
+        script_rows = []
+        dep_rows = []
+        plsql_rows = []
+        
+        normalize = self.normalize_script_name
+        plsql_columns = operator.itemgetter(0, 1, 2, 3, 5, 6, 7)
+        
+        # Parsing is CPU-bound and may run in worker processes; SQLite writes stay here.
+        # Files unchanged since the last scan reuse their stored parse
+        parser = self._parser_key()
+        outcomes, cache_rows, removed = self._analyze_files_cached(ksh_files, parser)
+        for filepath, (analysis, error) in zip(ksh_files, outcomes):
+            if error is not None:
+                error_msg = f"Error processing {filepath}: {error}"
                 self.logger.error(error_msg)
                 results['errors'].append(error_msg)
+                continue
+            
+            script_row, deps = analysis
+            results['dependencies'][script_row[0]] = deps
+            script_rows.append(script_row)
+            
+            # Script dependencies with normalized target names to prevent duplicates
+            dep_rows.extend((dep[0], normalize(dep[1]), 'script', dep[2], dep[3], dep[4])
+                            for dep in deps['scripts'])
+            
+            # CTL file dependencies
+            dep_rows.extend((dep[0], dep[1], 'ctl', dep[2], dep[3], dep[4])
+                            for dep in deps['ctl_files'])
+            
+            # PL/SQL calls: the extracted tuple minus its procedure column, picked in C
+            plsql_rows.extend(map(plsql_columns, deps['plsql_calls']))
         
-        conn.commit()
-        conn.close()
+        # Autocommit mode so BEGIN/COMMIT are under our control
+        conn = self._connect(isolation_level=None)
+        cursor = conn.cursor()
+        try:
+            cursor.execute('BEGIN')
+            
+            # Building indexes once after the load is cheaper than updating them per row
+            self._drop_indexes(cursor)
+            if self._search_index:
+                self._drop_search_index(cursor)
+            
+            # Clear existing data
+            cursor.execute('DELETE FROM scripts')
+            cursor.execute('DELETE FROM dependencies')
+            cursor.execute('DELETE FROM plsql_calls')
+            
+            cursor.executemany('''
+                INSERT OR REPLACE INTO scripts 
+                (filename, filepath, file_type, line_count, last_modified)
+                VALUES (?, ?, ?, ?, ?)
+            ''', script_rows)
+            
+            cursor.executemany('''
+                INSERT INTO dependencies 
+                (source_script, target_script, dependency_type, line_number, context, is_commented)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', dep_rows)
+            
+            cursor.executemany('''
+                INSERT INTO plsql_calls 
+                (source_script, procedure_name, schema_name, package_name, line_number, context, is_commented)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', plsql_rows)
+            
+            # Keep the parse cache to this directory's files and current rules
+            cursor.execute('DELETE FROM parse_cache WHERE parser != ?', (parser,))
+            cursor.executemany('DELETE FROM parse_cache WHERE filepath = ?', ((path,) for path in removed))
+            cursor.executemany('INSERT OR REPLACE INTO parse_cache VALUES (?, ?, ?, ?, ?)', cache_rows)
+            
+            self._create_indexes(cursor)
+            if self._search_index:
+                self._create_search_index(cursor)
+            cursor.execute('COMMIT')
+        except Exception:
+            if conn.in_transaction:
+                cursor.execute('ROLLBACK')
+            raise
+        finally:
+            conn.close()
+            self._invalidate_caches()
         
         self.logger.info(f"Analysis complete. Processed {len(ksh_files)} files")
         return results
@@ -295,79 +772,76 @@ class KSHAnalyzer:
         
         results = {
             'total_files': len(ctl_files),
-            'ctl_files': []
+            'ctl_files': [os.path.basename(filepath) for filepath in ctl_files]
         }
+        ctl_rows = [(filename, filepath, '') for filename, filepath in zip(results['ctl_files'], ctl_files)]
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Clear existing CTL data
-        cursor.execute('DELETE FROM ctl_files')
-        
-        for filepath in ctl_files:
-            try:
-                filename = os.path.basename(filepath)
-                results['ctl_files'].append(filename)
-                
-                cursor.execute('''
-                    INSERT OR REPLACE INTO ctl_files 
-                    (filename, filepath, referenced_by)
-                    VALUES (?, ?, ?)
-                ''', (filename, filepath, ''))
-                
-            except Exception as e:
-                error_msg = f"Error processing CTL file {filepath}: {e}"
-                self.logger.error(error_msg)
-        
-        conn.commit()
-        conn.close()
+        # The reused connection outlives this call: the with-block commits, or
+        # rolls back so no open transaction is left on it
+        conn = self._get_connection()
+        with conn:
+            cursor = conn.cursor()
+            
+            # Clear existing CTL data
+            cursor.execute('DELETE FROM ctl_files')
+            
+            # One statement for the whole batch, in scan order so INSERT OR
+            # REPLACE still keeps the last file of each name
+            cursor.executemany('''
+                INSERT OR REPLACE INTO ctl_files 
+                (filename, filepath, referenced_by)
+                VALUES (?, ?, ?)
+            ''', ctl_rows)
+        self._invalidate_caches()
         
         self.logger.info(f"CTL analysis complete. Found {len(ctl_files)} files")
         return results
     
     def get_forward_dependencies(self, script_name: str) -> List[Dict]:
         """Get what the script calls (forward dependencies)"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        # Copies, so callers may modify the result without touching the cache
+        return [dict(dep) for dep in self._forward_cache(script_name, self._cache_key())]
+    
+    def _query_forward_dependencies(self, script_name: str, cache_key: tuple) -> Tuple[Dict, ...]:
+        """Query forward dependencies; cache_key only partitions the memo"""
+        cursor = self._get_connection().cursor()
         
+        # Script/CTL dependencies, then PL/SQL calls, each by line, in one round trip
         cursor.execute('''
-            SELECT target_script, dependency_type, line_number, context, is_commented
+            SELECT 0 AS part, target_script, dependency_type, NULL, NULL,
+                   line_number, context, is_commented, id
             FROM dependencies
             WHERE source_script = ? AND is_commented = 0
-            ORDER BY line_number
-        ''', (script_name,))
-        
-        deps = []
-        for row in cursor.fetchall():
-            deps.append({
-                'target': row[0],
-                'type': row[1],
-                'line': row[2],
-                'context': row[3],
-                'commented': bool(row[4])
-            })
-        
-        # Add PL/SQL calls
-        cursor.execute('''
-            SELECT procedure_name, schema_name, package_name, line_number, context, is_commented
+            UNION ALL
+            SELECT 1 AS part, procedure_name, 'plsql', schema_name, package_name,
+                   line_number, context, is_commented, id
             FROM plsql_calls
             WHERE source_script = ? AND is_commented = 0
-            ORDER BY line_number
-        ''', (script_name,))
-        
-        for row in cursor.fetchall():
-            deps.append({
-                'target': row[0],
-                'type': 'plsql',
-                'schema': row[1],
-                'package': row[2],
-                'line': row[3],
-                'context': row[4],
-                'commented': bool(row[5])
-            })
-        
-        conn.close()
-        return deps
+            ORDER BY part, line_number, id
+        ''', (script_name, script_name))
+        
+        # Names recur across the cached lookups; interned, they are stored once
+        intern = _intern_text
+        deps = [{
+            'target': intern(row[1]),
+            'type': row[2],
+            'line': row[5],
+            'context': row[6],
+            'commented': bool(row[7])
+        } if row[0] == 0 else {
+            'target': intern(row[1]),
+            'type': 'plsql',
+            'schema': row[3],
+            'package': row[4],
+            # Display name, built once here (and cached) rather than by every view
+            'full_procedure': (f"{row[3]}.{row[4]}.{row[1]}" if row[3] and row[4]
+                               else f"{row[4]}.{row[1]}" if row[4] else row[1]),
+            'line': row[5],
+            'context': row[6],
+            'commented': bool(row[7])
+        } for row in cursor]
+        
+        return tuple(deps)
     
     def normalize_script_name(self, script_name: str) -> str:
         """Normalize script name by removing path prefixes like './' """
@@ -384,11 +858,13 @@ class KSHAnalyzer:
     
     def get_backward_dependencies(self, script_name: str) -> List[Dict]:
         """Get what calls the script (backward dependencies)"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         # Normalize the script name
         normalized_script = self.normalize_script_name(script_name)
+        return [dict(dep) for dep in self._backward_cache(normalized_script, self._cache_key())]
+    
+    def _query_backward_dependencies(self, normalized_script: str, cache_key: tuple) -> Tuple[Dict, ...]:
+        """Query backward dependencies; cache_key only partitions the memo"""
+        cursor = self._get_connection().cursor()
         
         # Search for the normalized script name (since we now store normalized names)
         cursor.execute('''
@@ -398,41 +874,74 @@ class KSHAnalyzer:
             ORDER BY source_script, line_number
         ''', (normalized_script,))
         
-        deps = []
-        for row in cursor.fetchall():
-            deps.append({
-                'source': row[0],
-                'type': row[1],
-                'line': row[2],
-                'context': row[3],
-                'commented': bool(row[4])
-            })
+        intern = _intern_text
+        deps = [{
+            'source': intern(row[0]),
+            'type': row[1],
+            'line': row[2],
+            'context': row[3],
+            'commented': bool(row[4])
+        } for row in cursor]
         
-        conn.close()
-        return deps
+        return tuple(deps)
     
     def get_all_scripts(self) -> List[str]:
         """Get list of all analyzed scripts"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._get_connection().cursor()
         
         cursor.execute('SELECT filename FROM scripts ORDER BY filename')
-        scripts = [row[0] for row in cursor.fetchall()]
+        scripts = [row[0] for row in cursor]
         
-        conn.close()
         return scripts
     
     def get_all_ctl_files(self) -> List[str]:
         """Get list of all CTL files"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._get_connection().cursor()
         
         cursor.execute('SELECT filename FROM ctl_files ORDER BY filename')
-        ctl_files = [row[0] for row in cursor.fetchall()]
+        ctl_files = [row[0] for row in cursor]
         
-        conn.close()
         return ctl_files
     
+    def get_dependency_counts(self) -> Dict[str, int]:
+        """Get the number of forward dependencies of every script in one query
+        
+        Returns:
+            Dictionary of script name to len(get_forward_dependencies(script));
+            scripts without active dependencies are absent
+        """
+        cursor = self._get_connection().cursor()
+        
+        # Same rows as the forward lookup: active script/CTL deps and PL/SQL calls
+        cursor.execute('''
+            SELECT source_script, COUNT(*)
+            FROM (
+                SELECT source_script FROM dependencies WHERE is_commented = 0
+                UNION ALL
+                SELECT source_script FROM plsql_calls WHERE is_commented = 0
+            )
+            GROUP BY source_script
+        ''')
+        counts = dict(cursor.fetchall())
+        
+        return counts
+    
+    def _search_index_filter(self, search_term: str) -> Tuple[str, tuple]:
+        """SQL prefix (and its parameters) limiting a '%term%' search to rows the trigram index can match
+        
+        Every row the LIKE conditions accept contains each run of the term between
+        LIKE wildcards, so requiring those runs in the index only skips rows that
+        could not match. Runs shorter than a trigram, non-ASCII terms (the index
+        folds more than LIKE's ASCII case) and databases without the index scan.
+        """
+        if not getattr(self, '_search_index', False) or not search_term.isascii():
+            return '', ()
+        runs = [run for run in re.split(r'[%_]', search_term) if len(run) >= 3]
+        if not runs:
+            return '', ()
+        query = ' AND '.join('"' + run.replace('"', '""') + '"' for run in runs)
+        return 'id IN (SELECT rowid FROM plsql_calls_fts WHERE plsql_calls_fts MATCH ?) AND ', (query,)
+    
     def search_plsql_procedure(self, search_term: str) -> List[Dict]:
         """Enhanced search for scripts that call PL/SQL procedures
         
@@ -442,59 +951,87 @@ class KSHAnalyzer:
         Returns:
             List of dictionaries containing calling scripts and details
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        # Copies, so callers may modify the result without touching the cache
+        return [dict(result) for result in self._search_cache(search_term, self._cache_key())]
+    
+    def _query_plsql_search(self, search_term: str, cache_key: tuple) -> Tuple[Dict, ...]:
+        """Run the search; cache_key only partitions the memo"""
+        cursor = self._get_connection().cursor()
         
         # Enhanced search patterns for better partial matching
         search_pattern = f"%{search_term}%"
         exact_pattern = search_term.lower()
         
         # Multiple search strategies for better results
-        cursor.execute('''
+        # SQLite's LIKE already ignores ASCII case and its LOWER() only folds
+        # ASCII, so LIKE on the raw columns and NOCASE equality against the
+        # lowered term match exactly what LOWER(...) did, without per-row calls
+        index_filter, index_params = self._search_index_filter(search_term)
+        cursor.execute(f'''
             SELECT source_script, procedure_name, schema_name, package_name, 
                    line_number, context, is_commented
             FROM plsql_calls
-            WHERE 
+            WHERE {index_filter}(
                 -- Exact procedure name match (highest priority)
-                LOWER(procedure_name) = ?
-                OR LOWER(procedure_name) LIKE ?
+                procedure_name = ? COLLATE NOCASE
+                OR procedure_name LIKE ?
                 -- Schema name match
-                OR LOWER(schema_name) LIKE ?
+                OR schema_name LIKE ?
                 -- Package name match
-                OR LOWER(package_name) LIKE ?
+                OR package_name LIKE ?
                 -- Full qualified name match (schema.package.procedure)
-                OR LOWER(COALESCE(schema_name, '') || '.' || COALESCE(package_name, '') || '.' || procedure_name) LIKE ?
+                OR (COALESCE(schema_name, '') || '.' || COALESCE(package_name, '') || '.' || procedure_name) LIKE ?
                 -- Context search (for procedures mentioned in comments or strings)
-                OR LOWER(context) LIKE ?
+                OR context LIKE ?
+            )
             ORDER BY 
                 -- Prioritize exact matches first
-                CASE WHEN LOWER(procedure_name) = ? THEN 1
-                     WHEN LOWER(procedure_name) LIKE ? THEN 2
-                     WHEN LOWER(package_name) LIKE ? THEN 3
-                     WHEN LOWER(schema_name) LIKE ? THEN 4
+                CASE WHEN procedure_name = ? COLLATE NOCASE THEN 1
+                     WHEN procedure_name LIKE ? THEN 2
+                     WHEN package_name LIKE ? THEN 3
+                     WHEN schema_name LIKE ? THEN 4
                      ELSE 5 END,
                 source_script, line_number
-        ''', (exact_pattern, search_pattern, search_pattern, search_pattern, 
+        ''', index_params + (exact_pattern, search_pattern, search_pattern, search_pattern, 
               search_pattern, search_pattern, exact_pattern, search_pattern, 
               search_pattern, search_pattern))
         
+        # Duplicates are dropped as rows arrive, keeping the first of each
+        # (script, line, procedure) in ranked order without building their dicts
         results = []
-        for row in cursor.fetchall():
-            # Build proper full procedure name with null handling
-            schema = row[2] or ''
-            package = row[3] or ''
-            procedure = row[1] or ''
+        seen = set()
+        # Calls repeat the same few procedures: each distinct name is built and
+        # ranked once, and all of its rows share those strings
+        procedures = {}
+        intern = _intern_text
+        for row in cursor:
+            names = procedures.get(row[1:4])
+            if names is None:
+                # Build proper full procedure name with null handling
+                schema = row[2] or ''
+                package = row[3] or ''
+                procedure = row[1] or ''
+                
+                # Create full procedure name based on available components
+                if schema and package:
+                    full_procedure = f"{schema}.{package}.{procedure}"
+                elif package:
+                    full_procedure = f"{package}.{procedure}"
+                else:
+                    full_procedure = procedure
+                
+                match_quality = self._get_match_quality(search_term, procedure, package, schema)
+                names = procedures[row[1:4]] = (procedure, schema, package, full_procedure, match_quality)
+            procedure, schema, package, full_procedure, match_quality = names
             
-            # Create full procedure name based on available components
-            if schema and package:
-                full_procedure = f"{schema}.{package}.{procedure}"
-            elif package:
-                full_procedure = f"{package}.{procedure}"
-            else:
-                full_procedure = procedure
+            source_script = intern(row[0])
+            key = (source_script, row[4], full_procedure)
+            if key in seen:
+                continue
+            seen.add(key)
             
             results.append({
-                'source_script': row[0],
+                'source_script': source_script,
                 'procedure_name': procedure,
                 'schema_name': schema,
                 'package_name': package,
@@ -502,21 +1039,10 @@ class KSHAnalyzer:
                 'line_number': row[4],
                 'context': row[5],
                 'is_commented': bool(row[6]),
-                'match_quality': self._get_match_quality(search_term, procedure, package, schema)
+                'match_quality': match_quality
             })
         
-        conn.close()
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_results = []
-        for result in results:
-            key = (result['source_script'], result['line_number'], result['full_procedure'])
-            if key not in seen:
-                seen.add(key)
-                unique_results.append(result)
-        
-        return unique_results
+        return tuple(results)
     
     def _get_match_quality(self, search_term: str, procedure: str, package: str, schema: str) -> str:
         """Determine the quality of the match for sorting purposes"""
@@ -535,8 +1061,7 @@ class KSHAnalyzer:
     
     def get_all_plsql_procedures(self) -> List[Dict]:
         """Get list of all unique PL/SQL procedures found in scripts"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._get_connection().cursor()
         
         cursor.execute('''
             SELECT DISTINCT schema_name, package_name, procedure_name,
@@ -546,37 +1071,34 @@ class KSHAnalyzer:
             ORDER BY schema_name, package_name, procedure_name
         ''')
         
-        procedures = []
-        for row in cursor.fetchall():
-            procedures.append({
-                'schema': row[0],
-                'package': row[1],
-                'procedure': row[2],
-                'full_name': f"{row[0]}.{row[1]}.{row[2]}",
-                'call_count': row[3]
-            })
+        procedures = [{
+            'schema': row[0],
+            'package': row[1],
+            'procedure': row[2],
+            'full_name': f"{row[0]}.{row[1]}.{row[2]}",
+            'call_count': row[3]
+        } for row in cursor]
         
-        conn.close()
         return procedures
     
     def cleanup_duplicate_plsql_calls(self):
         """Remove duplicate PL/SQL calls from database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Remove duplicates by keeping only the first occurrence of each unique combination
-        cursor.execute('''
-            DELETE FROM plsql_calls 
-            WHERE id NOT IN (
-                SELECT MIN(id) 
-                FROM plsql_calls 
-                GROUP BY source_script, procedure_name, schema_name, package_name, line_number
-            )
-        ''')
-        
-        duplicates_removed = cursor.rowcount
-        conn.commit()
-        conn.close()
+        conn = self._get_connection()
+        with conn:
+            cursor = conn.cursor()
+            
+            # Remove duplicates by keeping only the first occurrence of each unique combination
+            cursor.execute('''
+                DELETE FROM plsql_calls 
+                WHERE id NOT IN (
+                    SELECT MIN(id) 
+                    FROM plsql_calls 
+                    GROUP BY source_script, procedure_name, schema_name, package_name, line_number
+                )
+            ''')
+            
+            duplicates_removed = cursor.rowcount
+        self._invalidate_caches()
         
         if duplicates_removed > 0:
             self.logger.info(f"Removed {duplicates_removed} duplicate PL/SQL call entries")
@@ -592,68 +1114,93 @@ class KSHAnalyzer:
         Returns:
             List of dictionaries containing calling scripts and details with better matching
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        # Copies, so callers may modify the result without touching the cache
+        return [dict(result) for result in self._enhanced_search_cache(search_term, self._cache_key())]
+    
+    def _query_plsql_search_enhanced(self, search_term: str, cache_key: tuple) -> Tuple[Dict, ...]:
+        """Run the search; cache_key only partitions the memo"""
+        cursor = self._get_connection().cursor()
         
         # Enhanced search patterns for function-name-only searches
         search_pattern = f"%{search_term}%"
         exact_pattern = search_term.lower()
         
-        # Enhanced query with better function name matching
-        cursor.execute('''
+        # Enhanced query with better function name matching; as in
+        # search_plsql_procedure, LIKE and NOCASE equality against the lowered
+        # term match what LOWER() on every row did
+        index_filter, index_params = self._search_index_filter(search_term)
+        cursor.execute(f'''
             SELECT source_script, procedure_name, schema_name, package_name, 
                    line_number, context, is_commented
             FROM plsql_calls
-            WHERE 
+            WHERE {index_filter}(
                 -- Exact procedure name match (highest priority for function name only)
-                LOWER(procedure_name) = ?
-                OR LOWER(procedure_name) LIKE ?
+                procedure_name = ? COLLATE NOCASE
+                OR procedure_name LIKE ?
                 -- Extract function name from qualified calls (e.g., pkg.func_name)
-                OR LOWER(SUBSTR(procedure_name, INSTR(procedure_name, '.') + 1)) = ?
-                OR LOWER(SUBSTR(procedure_name, INSTR(procedure_name, '.') + 1)) LIKE ?
+                OR SUBSTR(procedure_name, INSTR(procedure_name, '.') + 1) = ? COLLATE NOCASE
+                OR SUBSTR(procedure_name, INSTR(procedure_name, '.') + 1) LIKE ?
                 -- Schema name match
-                OR LOWER(schema_name) LIKE ?
+                OR schema_name LIKE ?
                 -- Package name match  
-                OR LOWER(package_name) LIKE ?
+                OR package_name LIKE ?
                 -- Full qualified name match (schema.package.procedure)
-                OR LOWER(COALESCE(schema_name, '') || '.' || COALESCE(package_name, '') || '.' || procedure_name) LIKE ?
+                OR (COALESCE(schema_name, '') || '.' || COALESCE(package_name, '') || '.' || procedure_name) LIKE ?
                 -- Context search (for procedures mentioned in comments or strings)
-                OR LOWER(context) LIKE ?
+                OR context LIKE ?
+            )
             ORDER BY 
                 -- Prioritize exact function name matches first
-                CASE WHEN LOWER(procedure_name) = ? THEN 1
-                     WHEN LOWER(SUBSTR(procedure_name, INSTR(procedure_name, '.') + 1)) = ? THEN 2
-                     WHEN LOWER(procedure_name) LIKE ? THEN 3
-                     WHEN LOWER(SUBSTR(procedure_name, INSTR(procedure_name, '.') + 1)) LIKE ? THEN 4
-                     WHEN LOWER(package_name) LIKE ? THEN 5
-                     WHEN LOWER(schema_name) LIKE ? THEN 6
+                CASE WHEN procedure_name = ? COLLATE NOCASE THEN 1
+                     WHEN SUBSTR(procedure_name, INSTR(procedure_name, '.') + 1) = ? COLLATE NOCASE THEN 2
+                     WHEN procedure_name LIKE ? THEN 3
+                     WHEN SUBSTR(procedure_name, INSTR(procedure_name, '.') + 1) LIKE ? THEN 4
+                     WHEN package_name LIKE ? THEN 5
+                     WHEN schema_name LIKE ? THEN 6
                      ELSE 7 END,
                 source_script, line_number
-        ''', (exact_pattern, search_pattern, exact_pattern, search_pattern,
+        ''', index_params + (exact_pattern, search_pattern, exact_pattern, search_pattern,
               search_pattern, search_pattern, search_pattern, search_pattern,
               exact_pattern, exact_pattern, search_pattern, search_pattern,
               search_pattern, search_pattern))
         
+        # Duplicates are dropped as rows arrive, keeping the first of each
+        # (script, line, procedure) in ranked order without building their dicts
         results = []
-        for row in cursor.fetchall():
-            # Build proper full procedure name with null handling
-            schema = row[2] or ''
-            package = row[3] or ''
-            procedure = row[1] or ''
-            
-            # Create full procedure name based on available components
-            if schema and package:
-                full_procedure = f"{schema}.{package}.{procedure}"
-            elif package:
-                full_procedure = f"{package}.{procedure}"
-            else:
-                full_procedure = procedure
+        seen = set()
+        # Calls repeat the same few procedures: each distinct name is built and
+        # ranked once, and all of its rows share those strings
+        procedures = {}
+        intern = _intern_text
+        for row in cursor:
+            names = procedures.get(row[1:4])
+            if names is None:
+                # Build proper full procedure name with null handling
+                schema = row[2] or ''
+                package = row[3] or ''
+                procedure = row[1] or ''
+                
+                # Create full procedure name based on available components
+                if schema and package:
+                    full_procedure = f"{schema}.{package}.{procedure}"
+                elif package:
+                    full_procedure = f"{package}.{procedure}"
+                else:
+                    full_procedure = procedure
+                
+                # Enhanced match quality for function-name searches
+                match_quality = self._get_enhanced_match_quality(search_term, procedure, package, schema)
+                names = procedures[row[1:4]] = (procedure, schema, package, full_procedure, match_quality)
+            procedure, schema, package, full_procedure, match_quality = names
             
-            # Enhanced match quality for function-name searches
-            match_quality = self._get_enhanced_match_quality(search_term, procedure, package, schema)
+            source_script = intern(row[0])
+            key = (source_script, row[4], full_procedure)
+            if key in seen:
+                continue
+            seen.add(key)
             
             results.append({
-                'source_script': row[0],
+                'source_script': source_script,
                 'procedure_name': procedure,
                 'schema_name': schema,
                 'package_name': package,
@@ -664,18 +1211,7 @@ class KSHAnalyzer:
                 'match_quality': match_quality
             })
         
-        conn.close()
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_results = []
-        for result in results:
-            key = (result['source_script'], result['line_number'], result['full_procedure'])
-            if key not in seen:
-                seen.add(key)
-                unique_results.append(result)
-        
-        return unique_results
+        return tuple(results)
     
     def _get_enhanced_match_quality(self, search_term: str, procedure: str, package: str, schema: str) -> str:
         """Enhanced match quality determination for function-name searches"""
@@ -712,16 +1248,17 @@ class KSHAnalyzer:
         Returns:
             List of calling scripts with details
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._get_connection().cursor()
         
+        # NOCASE folds ASCII exactly like SQLite's LOWER() did, and lets the
+        # procedure-name lookup use idx_plsql_proc
         if '.' in procedure_name:
             # Exact match for full procedure name
             cursor.execute('''
                 SELECT source_script, procedure_name, schema_name, package_name, 
                        line_number, context, is_commented
                 FROM plsql_calls
-                WHERE LOWER(schema_name || '.' || package_name || '.' || procedure_name) = LOWER(?)
+                WHERE (schema_name || '.' || package_name || '.' || procedure_name) = ? COLLATE NOCASE
                 ORDER BY source_script, line_number
             ''', (procedure_name,))
         else:
@@ -730,57 +1267,50 @@ class KSHAnalyzer:
                 SELECT source_script, procedure_name, schema_name, package_name, 
                        line_number, context, is_commented
                 FROM plsql_calls
-                WHERE LOWER(procedure_name) = LOWER(?)
+                WHERE procedure_name = ? COLLATE NOCASE
                 ORDER BY source_script, line_number
             ''', (procedure_name,))
         
-        results = []
-        for row in cursor.fetchall():
-            results.append({
-                'source_script': row[0],
-                'procedure_name': row[1],
-                'schema_name': row[2],
-                'package_name': row[3],
-                'full_procedure': f"{row[2]}.{row[3]}.{row[1]}",
-                'line_number': row[4],
-                'context': row[5],
-                'is_commented': bool(row[6])
-            })
+        results = [{
+            'source_script': row[0],
+            'procedure_name': row[1],
+            'schema_name': row[2],
+            'package_name': row[3],
+            'full_procedure': f"{row[2]}.{row[3]}.{row[1]}",
+            'line_number': row[4],
+            'context': row[5],
+            'is_commented': bool(row[6])
+        } for row in cursor]
         
-        conn.close()
         return results
     
     def save_directory_paths(self, ksh_dir: str, ctl_dir: str):
         """Save directory paths to database for persistence"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        import datetime
         timestamp = datetime.datetime.now().isoformat()
         
-        # Save KSH directory
-        cursor.execute('''
-            INSERT OR REPLACE INTO user_settings 
-            (setting_name, setting_value, last_updated)
-            VALUES (?, ?, ?)
-        ''', ('ksh_directory', ksh_dir, timestamp))
-        
-        # Save CTL directory
-        cursor.execute('''
-            INSERT OR REPLACE INTO user_settings 
-            (setting_name, setting_value, last_updated)
-            VALUES (?, ?, ?)
-        ''', ('ctl_directory', ctl_dir, timestamp))
-        
-        conn.commit()
-        conn.close()
+        conn = self._get_connection()
+        with conn:
+            cursor = conn.cursor()
+            
+            # Save KSH directory
+            cursor.execute('''
+                INSERT OR REPLACE INTO user_settings 
+                (setting_name, setting_value, last_updated)
+                VALUES (?, ?, ?)
+            ''', ('ksh_directory', ksh_dir, timestamp))
+            
+            # Save CTL directory
+            cursor.execute('''
+                INSERT OR REPLACE INTO user_settings 
+                (setting_name, setting_value, last_updated)
+                VALUES (?, ?, ?)
+            ''', ('ctl_directory', ctl_dir, timestamp))
         
         self.logger.info(f"Saved directory paths: KSH={ksh_dir}, CTL={ctl_dir}")
     
     def load_directory_paths(self) -> tuple:
         """Load saved directory paths from database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._get_connection().cursor()
         
         try:
             cursor.execute('''
@@ -797,49 +1327,59 @@ class KSHAnalyzer:
             ctl_result = cursor.fetchone()
             ctl_dir = ctl_result[0] if ctl_result else ""
             
-            conn.close()
-            
             self.logger.info(f"Loaded directory paths: KSH={ksh_dir}, CTL={ctl_dir}")
             return ksh_dir, ctl_dir
             
         except Exception as e:
             self.logger.error(f"Error loading directory paths: {e}")
-            conn.close()
             return "", ""
     
+    def _write_json_array(self, f, rows):
+        """Stream dicts as a JSON array laid out like json.dump(indent=2) at depth 1"""
+        # Values go through the C-accelerated default encoder; only the
+        # indented layout around them is built here
+        encode = json.dumps
+        first = True
+        for row in rows:
+            f.write(('[\n    {\n      ' if first else ',\n    {\n      ') +
+                    ',\n      '.join(f'{encode(key)}: {encode(value)}' for key, value in row.items()) +
+                    '\n    }')
+            first = False
+        f.write('[]' if first else '\n  ]')
+    
     def export_dependencies(self, output_file: str, format: str = 'json'):
         """Export dependencies to various formats"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        if format.lower() != 'json':
+            self.logger.info(f"Dependencies exported to {output_file}")
+            return
         
-        # Get all dependencies
-        cursor.execute('''
-            SELECT source_script, target_script, dependency_type, line_number, context, is_commented
-            FROM dependencies
-            ORDER BY source_script, line_number
-        ''')
+        cursor = self._get_connection().cursor()
         
-        dependencies = []
-        for row in cursor.fetchall():
-            dependencies.append({
+        # Rows are streamed from the cursor straight into the file, so no full
+        # lists of dicts are held in memory; the output matches json.dump(indent=2)
+        with open(output_file, 'w') as f:
+            f.write('{\n  "dependencies": ')
+            cursor.execute('''
+                SELECT source_script, target_script, dependency_type, line_number, context, is_commented
+                FROM dependencies
+                ORDER BY source_script, line_number
+            ''')
+            self._write_json_array(f, ({
                 'source': row[0],
                 'target': row[1],
                 'type': row[2],
                 'line': row[3],
                 'context': row[4],
                 'commented': bool(row[5])
-            })
-        
-        # Get PL/SQL calls
-        cursor.execute('''
-            SELECT source_script, procedure_name, schema_name, package_name, line_number, context, is_commented
-            FROM plsql_calls
-            ORDER BY source_script, line_number
-        ''')
-        
-        plsql_calls = []
-        for row in cursor.fetchall():
-            plsql_calls.append({
+            } for row in cursor))
+                
+            f.write(',\n  "plsql_calls": ')
+            cursor.execute('''
+                SELECT source_script, procedure_name, schema_name, package_name, line_number, context, is_commented
+                FROM plsql_calls
+                ORDER BY source_script, line_number
+            ''')
+            self._write_json_array(f, ({
                 'source': row[0],
                 'procedure': row[1],
                 'schema': row[2],
@@ -847,19 +1387,10 @@ class KSHAnalyzer:
                 'line': row[4],
                 'context': row[5],
                 'commented': bool(row[6])
-            })
-        
-        conn.close()
-        
-        export_data = {
-            'dependencies': dependencies,
-            'plsql_calls': plsql_calls,
-            'export_timestamp': str(os.path.getmtime(self.db_path)) if os.path.exists(self.db_path) else 'N/A'
-        }
-        
-        if format.lower() == 'json':
-            with open(output_file, 'w') as f:
-                json.dump(export_data, f, indent=2)
+            } for row in cursor))
+                
+            export_timestamp = str(os.path.getmtime(self.db_path)) if os.path.exists(self.db_path) else 'N/A'
+            f.write(',\n  "export_timestamp": ' + json.dumps(export_timestamp) + '\n}')
         
         self.logger.info(f"Dependencies exported to {output_file}")
 
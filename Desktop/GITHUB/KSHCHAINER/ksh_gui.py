@@ -6,20 +6,76 @@ Tkinter-based GUI for analyzing KSH script dependencies
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+import tkinter.font as tkfont
 import threading
+import functools
 import os
 import json
 from typing import Dict, List
-import sqlite3
 import datetime
-import tempfile
-import subprocess
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from ksh_analyzer import KSHAnalyzer
 
+_ABOUT_TEXT = """KSH Script Dependency Analyzer
+        
+Version: 1.2
+Author: Assistant
+        
+This application analyzes KSH/SH scripts to identify:
+- Script-to-script dependencies
+- CTL file references
+- PL/SQL procedure calls
+
+Features:
+- Bidirectional dependency mapping
+- Visual dependency graphs with improved dragging
+- Mouse wheel zoom and cursor-centered zooming
+- Image export (PostScript and text formats)
+- PL/SQL procedure search
+- Export functionality
+- Search and filter capabilities
+
+Controls:
+- Mouse wheel: Zoom in/out at cursor position
+- Drag: Move visualization elements
+- Ctrl+Plus/Minus: Zoom in/out
+- Ctrl+0: Reset zoom
+- Save Image: Export visualization to PostScript or text"""
+
 class KSHAnalyzerGUI:
     """Main GUI class for KSH Script Dependency Analyzer"""
     
+    # Explorer folders with more entries than this start collapsed and are
+    # filled in the first time they are expanded
+    lazy_folder_threshold = 500
+    
+    # Result lists insert this many rows at a time; the next page is added
+    # when the view is scrolled near the end
+    tree_page_size = 200
+    
+    # Display text for the analyzer's PL/SQL match_quality values, including function-name matches
+    match_quality_labels = {
+        'exact_procedure': '🎯 Exact Procedure',
+        'exact_function_name': '🎯 Exact Function',
+        'partial_procedure': '📝 Partial Procedure',
+        'partial_function_name': '📝 Partial Function',
+        'package_match': '📦 Package',
+        'schema_match': '🏢 Schema',
+        'context_match': '📄 Context',
+        'unknown': '❓ Unknown'
+    }
+    
+    # PL/SQL result status, indexed by the analyzer's is_commented flag
+    call_status_labels = ("Active", "Commented")
+    
+    # Visualization box fill, outline and icon by dependency type
+    dependency_styles = {
+        'script': ('lightgreen', 'darkgreen', '📜'),
+        'ctl': ('lightyellow', 'orange', '📄'),
+        'plsql': ('lightcoral', 'darkred', '⚡'),
+    }
+    
     def __init__(self, root):
         self.root = root
         self.root.title("KSH Script Dependency Analyzer")
@@ -27,6 +83,10 @@ class KSHAnalyzerGUI:
         
         # Initialize analyzer
         self.analyzer = KSHAnalyzer()
+        # One background worker for database work, so it keeps one reused connection
+        self._db_worker = ThreadPoolExecutor(max_workers=1)
+        # Set once the window starts closing; background results are then dropped
+        self._closing = False
         
         # Variables
         self.ksh_dir = tk.StringVar()
@@ -36,6 +96,18 @@ class KSHAnalyzerGUI:
         # Data storage
         self.scripts_data = {}
         self.dependencies_data = {}
+        # Explorer folder id -> (file names, type) still to be inserted
+        self._pending_children = {}
+        # Script name -> forward dependency count, loaded with the explorer lists
+        self._dep_counts = {}
+        # Result tree -> [rows, index of the next row to insert, page already queued]
+        self._tree_pages = {}
+        # Full explorer contents captured for the script search (None until needed)
+        self._original_tree_structure = None
+        # True once the explorer shows the search's flat rows instead of its folders
+        self._search_view = False
+        # (term, matching items) of the last script search over that snapshot
+        self._last_script_search = (None, [])
         
         # Initialize drag tracking
         self.dragging = None
@@ -44,6 +116,18 @@ class KSHAnalyzerGUI:
         self.canvas_objects = {}
         self.element_connections = {}
         
+        # Chains walked for the visualization, per script and analyzer data version
+        self._chain_cache = functools.lru_cache(maxsize=256)(self._walk_dependency_chain)
+        
+        # Visualization fonts, created once and passed to the canvas by name
+        # instead of as tuples Tk resolves again for every text item
+        self.vis_font = tkfont.Font(family='Arial', size=8)
+        self.vis_font_chain = tkfont.Font(family='Arial', size=9, weight='bold')
+        self.vis_font_center = tkfont.Font(family='Arial', size=10, weight='bold')
+        
+        # (text, font name) -> measured (width, height) for visualization boxes
+        self._text_dimensions = {}
+        
         # Zoom tracking
         self.zoom_factor = 1.0
         self.min_zoom = 0.1
@@ -56,6 +140,9 @@ class KSHAnalyzerGUI:
         self.root.bind('<F3>', lambda e: self.open_selected_script())
         self.root.bind('<Control-o>', lambda e: self.open_current_in_external_editor())
         
+        # Stop background work before the window and database go away
+        self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+        
         # Load saved directory paths on startup
         self.load_saved_paths()
         
@@ -72,7 +159,7 @@ class KSHAnalyzerGUI:
         file_menu.add_separator()
         file_menu.add_command(label="Export Dependencies...", command=self.export_dependencies)
         file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.root.quit)
+        file_menu.add_command(label="Exit", command=self.on_closing)
         
         # View menu
         view_menu = tk.Menu(menubar, tearoff=0)
@@ -179,6 +266,7 @@ class KSHAnalyzerGUI:
         
         # Bind selection event
         self.script_tree.bind('<<TreeviewSelect>>', self.on_script_select)
+        self.script_tree.bind('<<TreeviewOpen>>', self.on_folder_open)
         
         # Bind right-click context menu
         self.script_tree.bind('<Button-3>', self.show_script_context_menu)
@@ -193,9 +281,13 @@ class KSHAnalyzerGUI:
         self.search_var = tk.StringVar()
         self.search_entry = ttk.Entry(search_frame, textvariable=self.search_var)
         self.search_entry.grid(row=0, column=1, sticky=(tk.W, tk.E))
-        self.search_entry.bind('<KeyRelease>', self.on_search)
+        # Filter once typing pauses instead of rebuilding the tree per keystroke
+        self.search_entry.bind('<KeyRelease>', self._delayed_script_search)
         self.search_entry.bind('<Return>', self.on_search)
         
+        # Add timer for delayed search
+        self._script_search_timer = None
+        
         # Add clear button for script search
         ttk.Button(search_frame, text="✗", command=self.clear_script_search).grid(row=0, column=2, padx=(2, 0))
         
@@ -214,6 +306,8 @@ class KSHAnalyzerGUI:
         
         # Add timer for delayed search
         self._plsql_search_timer = None
+        # Term of the results on display, so keys that leave it unchanged skip the search
+        self._plsql_searched_term = ''
 
         ttk.Button(plsql_search_frame, text="🔍", command=self.on_global_plsql_search).grid(row=0, column=2)
         
@@ -245,7 +339,7 @@ class KSHAnalyzerGUI:
         self.forward_tree.heading('commented', text='Status')
         
         forward_scrollbar = ttk.Scrollbar(self.forward_frame, orient=tk.VERTICAL, command=self.forward_tree.yview)
-        self.forward_tree.configure(yscrollcommand=forward_scrollbar.set)
+        self.forward_tree.configure(yscrollcommand=self._paged_yscroll(self.forward_tree, forward_scrollbar))
         
         self.forward_tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         forward_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
@@ -264,7 +358,7 @@ class KSHAnalyzerGUI:
         self.backward_tree.heading('commented', text='Status')
         
         backward_scrollbar = ttk.Scrollbar(self.backward_frame, orient=tk.VERTICAL, command=self.backward_tree.yview)
-        self.backward_tree.configure(yscrollcommand=backward_scrollbar.set)
+        self.backward_tree.configure(yscrollcommand=self._paged_yscroll(self.backward_tree, backward_scrollbar))
         
         self.backward_tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         backward_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
@@ -305,7 +399,8 @@ class KSHAnalyzerGUI:
         self.global_plsql_results_tree.column('match_quality', width=120)
         
         global_plsql_scrollbar = ttk.Scrollbar(plsql_results_frame, orient=tk.VERTICAL, command=self.global_plsql_results_tree.yview)
-        self.global_plsql_results_tree.configure(yscrollcommand=global_plsql_scrollbar.set)
+        self.global_plsql_results_tree.configure(
+            yscrollcommand=self._paged_yscroll(self.global_plsql_results_tree, global_plsql_scrollbar))
         
         self.global_plsql_results_tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         global_plsql_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
@@ -452,10 +547,10 @@ class KSHAnalyzerGUI:
             ctl_results = self.analyzer.analyze_ctl_directory(self.ctl_dir.get())
             
             # Update GUI in main thread
-            self.root.after(0, self._update_results, ksh_results, ctl_results)
+            self._post_to_tk(self._update_results, ksh_results, ctl_results)
             
         except Exception as e:
-            self.root.after(0, self._scan_error, str(e))
+            self._post_to_tk(self._scan_error, str(e))
             
     def _update_results(self, ksh_results, ctl_results):
         """Update GUI with scan results"""
@@ -464,10 +559,13 @@ class KSHAnalyzerGUI:
         # Save directory paths for future use
         self.analyzer.save_directory_paths(self.ksh_dir.get(), self.ctl_dir.get())
         
-        # Update script tree
-        self.update_script_tree(ksh_results, ctl_results)
+        # Update script tree; the scan is reported done once the explorer is filled
+        self.status_label.config(text="Loading scripts...")
+        self.update_script_tree(ksh_results, ctl_results,
+                                lambda: self._scan_loaded(ksh_results, ctl_results))
         
-        # Update status
+    def _scan_loaded(self, ksh_results, ctl_results):
+        """Report a finished scan after its results are shown in the explorer"""
         total_scripts = ksh_results['total_files']
         total_ctl = ctl_results['total_files']
         self.status_label.config(text=f"Ready | Scripts: {total_scripts} | CTL Files: {total_ctl}")
@@ -480,35 +578,117 @@ class KSHAnalyzerGUI:
         self.status_label.config(text="Error occurred during scan")
         messagebox.showerror("Scan Error", f"Error during scan: {error_msg}")
         
-    def update_script_tree(self, ksh_results, ctl_results):
-        """Update the script tree with results"""
+    def _run_async(self, work, on_done, on_error):
+        """Run work() on the database worker; its result or error message is handed back on the Tk thread"""
+        def finished(future):
+            try:
+                result = future.result()
+            except Exception as e:
+                self._post_to_tk(on_error, str(e))
+            else:
+                self._post_to_tk(on_done, result)
+        
+        self._db_worker.submit(work).add_done_callback(finished)
+    
+    def _post_to_tk(self, callback, *args):
+        """Hand callback(*args) from a background thread to the Tk thread, unless the window is closing"""
+        if self._closing:
+            return
+        try:
+            self.root.after(0, callback, *args)
+        except (RuntimeError, tk.TclError):
+            # The window was destroyed between the check and the call
+            pass
+    
+    def on_closing(self):
+        """Drop queued background work, release the database and close the window"""
+        self._closing = True
+        self._db_worker.shutdown(wait=False, cancel_futures=True)
+        self.analyzer.close()
+        self.root.destroy()
+    
+    def update_script_tree(self, ksh_results, ctl_results, on_loaded=None):
+        """Update the script tree with results; on_loaded() runs once the tree is filled"""
+        # The lists and counts are queried in the background; the tree is filled on the Tk thread
+        def fill(data):
+            self._fill_script_tree(ksh_results, ctl_results, *data)
+            if on_loaded is not None:
+                on_loaded()
+        
+        self._run_async(self._load_script_lists, fill, self._tree_load_error)
+    
+    def _load_script_lists(self):
+        """Query the explorer's script and CTL lists and dependency counts (database worker)"""
+        return (self.analyzer.get_all_scripts(), self.analyzer.get_all_ctl_files(),
+                self.analyzer.get_dependency_counts())
+    
+    def _fill_script_tree(self, ksh_results, ctl_results, scripts, ctl_files, dep_counts):
+        """Fill the script tree from the loaded lists"""
         # Clear existing items
-        for item in self.script_tree.get_children():
-            self.script_tree.delete(item)
+        self._clear_script_tree()
+        self._pending_children.clear()
+        self._original_tree_structure = None
+        self._dep_counts = dep_counts
             
         # Add KSH Scripts folder
         ksh_node = self.script_tree.insert('', 'end', text=f"📁 KSH Scripts ({ksh_results['total_files']})", 
                                           values=('folder', ''))
         
         # Add scripts
-        scripts = self.analyzer.get_all_scripts()
-        for script in scripts:
-            forward_deps = self.analyzer.get_forward_dependencies(script)
-            dep_count = len(forward_deps)
-            self.script_tree.insert(ksh_node, 'end', text=script, values=('ksh', dep_count))
+        self._add_folder_children(ksh_node, scripts, 'ksh')
             
         # Add CTL Files folder
         ctl_node = self.script_tree.insert('', 'end', text=f"📁 CTL Files ({ctl_results['total_files']})", 
                                           values=('folder', ''))
         
         # Add CTL files
-        ctl_files = self.analyzer.get_all_ctl_files()
-        for ctl_file in ctl_files:
-            self.script_tree.insert(ctl_node, 'end', text=ctl_file, values=('ctl', ''))
-            
-        # Expand folders
-        self.script_tree.item(ksh_node, open=True)
-        self.script_tree.item(ctl_node, open=True)
+        self._add_folder_children(ctl_node, ctl_files, 'ctl')
+    
+    def _tree_load_error(self, error_msg):
+        """Handle errors while loading the script tree"""
+        self.status_label.config(text="Error loading scripts")
+        messagebox.showerror("Error", f"Failed to load scripts: {error_msg}")
+    
+    def _add_folder_children(self, node, names, file_type):
+        """Fill an explorer folder now, or defer a large one until it is expanded"""
+        if len(names) <= self.lazy_folder_threshold:
+            self._insert_folder_children(node, names, file_type)
+            # Expand folders
+            self.script_tree.item(node, open=True)
+        else:
+            # A placeholder child keeps the expand arrow until the folder is opened;
+            # without values it is skipped like a folder by selection and the context menu
+            self.script_tree.insert(node, 'end', text='Loading...')
+            self._pending_children[node] = (names, file_type)
+    
+    def _insert_folder_children(self, node, names, file_type):
+        """Insert the file entries of an explorer folder"""
+        insert = self.script_tree.insert
+        if file_type == 'ksh':
+            # Counts come from one aggregate query made when the lists were loaded
+            dep_counts = self._dep_counts
+            for name in names:
+                insert(node, 'end', text=name, values=('ksh', dep_counts.get(name, 0)))
+        else:
+            for name in names:
+                insert(node, 'end', text=name, values=(file_type, ''))
+    
+    def _populate_folder(self, node):
+        """Replace a deferred folder's placeholder with its file entries"""
+        pending = self._pending_children.pop(node, None)
+        if pending is None:
+            return
+        self.script_tree.delete(*self.script_tree.get_children(node))
+        self._insert_folder_children(node, *pending)
+    
+    def _populate_all_folders(self):
+        """Fill every deferred folder (the search works on the full tree)"""
+        for node in list(self._pending_children):
+            self._populate_folder(node)
+    
+    def on_folder_open(self, event):
+        """Fill a deferred explorer folder the first time it is expanded"""
+        self._populate_folder(self.script_tree.focus())
         
     def on_script_select(self, event):
         """Handle script selection in tree"""
@@ -519,65 +699,97 @@ class KSHAnalyzerGUI:
         item = selection[0]
         script_name = self.script_tree.item(item, 'text')
         
-        # Skip folder items
-        if script_name.startswith('📁'):
+        # Skip folder items and the placeholder of a deferred folder
+        if script_name.startswith('📁') or not self.script_tree.item(item, 'values'):
             return
             
         self.current_script.set(script_name)
         self.selected_label.config(text=f"Selected: {script_name}")
         
+        # Look the dependencies up once for both views
+        forward_deps = self.analyzer.get_forward_dependencies(script_name)
+        backward_deps = self.analyzer.get_backward_dependencies(script_name)
+        
         # Update dependency views
-        self.update_dependency_views(script_name)
+        self.update_dependency_views(script_name, forward_deps, backward_deps)
         
         # Update visualization
-        self.update_visualization(script_name)
+        self.update_visualization(script_name, forward_deps, backward_deps)
         
-    def update_dependency_views(self, script_name):
-        """Update forward and backward dependency views"""
+    def update_dependency_views(self, script_name, forward_deps=None, backward_deps=None):
+        """Update forward and backward dependency views (lists are looked up when not given)"""
         # Clear existing items
-        for item in self.forward_tree.get_children():
-            self.forward_tree.delete(item)
-        for item in self.backward_tree.get_children():
-            self.backward_tree.delete(item)
+        self._clear_result_tree(self.forward_tree)
+        self._clear_result_tree(self.backward_tree)
             
         # Update forward dependencies (commented dependencies are now excluded by analyzer)
-        forward_deps = self.analyzer.get_forward_dependencies(script_name)
-        for dep in forward_deps:
-            status = "Active"  # All dependencies are active since commented ones are excluded
-            if dep['type'] == 'plsql':
-                # Build proper PL/SQL name format
-                schema = dep.get('schema', '')
-                package = dep.get('package', '')
-                procedure = dep['target']
-                
-                if schema and package:
-                    target = f"{schema}.{package}.{procedure}"
-                elif package:
-                    target = f"{package}.{procedure}"
-                else:
-                    target = procedure
-            else:
-                target = dep['target']
-            self.forward_tree.insert('', 'end', text=target, 
-                                   values=(dep['type'], dep['line'], status))
+        if forward_deps is None:
+            forward_deps = self.analyzer.get_forward_dependencies(script_name)
+        status = "Active"  # All dependencies are active since commented ones are excluded
+        # PL/SQL calls are shown by the qualified name the analyzer already built
+        self._fill_tree_paged(self.forward_tree, [
+            (dep['full_procedure'] if dep['type'] == 'plsql' else dep['target'],
+             (dep['type'], dep['line'], status)) for dep in forward_deps
+        ])
             
         # Update backward dependencies (commented dependencies are now excluded by analyzer)
-        backward_deps = self.analyzer.get_backward_dependencies(script_name)
-        for dep in backward_deps:
-            status = "Active"  # All dependencies are active since commented ones are excluded
-            self.backward_tree.insert('', 'end', text=dep['source'], 
-                                    values=(dep['type'], dep['line'], status))
+        if backward_deps is None:
+            backward_deps = self.analyzer.get_backward_dependencies(script_name)
+        status = "Active"  # All dependencies are active since commented ones are excluded
+        self._fill_tree_paged(self.backward_tree, [
+            (dep['source'], (dep['type'], dep['line'], status)) for dep in backward_deps
+        ])
+    
+    def _paged_yscroll(self, tree, scrollbar):
+        """yscrollcommand for a paged result tree: moves the scrollbar, loads the next page near the end"""
+        def on_scroll(first, last):
+            scrollbar.set(first, last)
+            pending = self._tree_pages.get(tree)
+            if float(last) >= 0.9 and pending is not None and not pending[2]:
+                # Not inserted from inside the scroll callback itself; one page
+                # at a time, however many callbacks arrive before it runs
+                pending[2] = True
+                self.root.after_idle(self._insert_next_page, tree)
+        return on_scroll
+    
+    def _clear_result_tree(self, tree):
+        """Empty a paged result tree with one delete call and drop its pending rows"""
+        tree.delete(*tree.get_children())
+        self._tree_pages.pop(tree, None)
+    
+    def _fill_tree_paged(self, tree, rows):
+        """Show (text, values) rows in an emptied result tree, one page at a time"""
+        self._tree_pages[tree] = [rows, 0, False]
+        self._insert_next_page(tree)
+    
+    def _insert_next_page(self, tree):
+        """Insert the next page of a result tree's pending rows"""
+        pending = self._tree_pages.get(tree)
+        if pending is None:
+            return
+        rows, start, _ = pending
+        end = start + self.tree_page_size
+        insert = tree.insert
+        for text, values in rows[start:end]:
+            insert('', 'end', text=text, values=values)
+        if end >= len(rows):
+            del self._tree_pages[tree]
+        else:
+            pending[1] = end
+            pending[2] = False
                                     
-    def update_visualization(self, script_name):
-        """Update dependency visualization with draggable elements"""
+    def update_visualization(self, script_name, forward_deps=None, backward_deps=None):
+        """Update dependency visualization with draggable elements (lists are looked up when not given)"""
         # Clear canvas and tracking variables
         self.canvas.delete("all")
         self.canvas_objects = {}
         self.element_connections = {}
         
         # Get dependencies
-        forward_deps = self.analyzer.get_forward_dependencies(script_name)
-        backward_deps = self.analyzer.get_backward_dependencies(script_name)
+        if forward_deps is None:
+            forward_deps = self.analyzer.get_forward_dependencies(script_name)
+        if backward_deps is None:
+            backward_deps = self.analyzer.get_backward_dependencies(script_name)
         
         # Build dependency chain if script is part of one
         chain = self.build_dependency_chain(script_name)
@@ -590,10 +802,19 @@ class KSHAnalyzerGUI:
             self.draw_star_diagram(script_name, forward_deps, backward_deps)
         
         # Update scroll region
+        self._update_scroll_region()
+    
+    def _update_scroll_region(self):
+        """Measure the drawing once and use it as the canvas scroll region"""
         self.canvas.configure(scrollregion=self.canvas.bbox("all"))
     
     def build_dependency_chain(self, script_name):
         """Build dependency chain starting from the given script"""
+        # Reselecting a script reuses its walk until the data changes
+        return list(self._chain_cache(script_name, self.analyzer.data_version()))
+    
+    def _walk_dependency_chain(self, script_name, data_version):
+        """Walk the chain through the analyzer; data_version only partitions the memo"""
         chain = [script_name]
         visited = {script_name}
         
@@ -683,7 +904,7 @@ class KSHAnalyzerGUI:
             if len(backward_chain) > 10:
                 break
         
-        return backward_chain + chain
+        return tuple(backward_chain + chain)
     
     def draw_dependency_chain(self, chain, selected_script):
         """Draw dependency chain visualization with auto-sized rectangles and connected arrows"""
@@ -704,7 +925,7 @@ class KSHAnalyzerGUI:
         positions = []
         
         for script in chain:
-            text_width, text_height = self.calculate_text_dimensions(script, ('Arial', 9, 'bold'))
+            text_width, text_height = self.calculate_text_dimensions(script, self.vis_font_chain)
             text_dimensions[script] = (text_width, text_height)
             box_width = max(text_width + 20, 100)
             box_widths[script] = box_width
@@ -764,7 +985,7 @@ class KSHAnalyzerGUI:
             
             # Create draggable text (no truncation)
             text = self.canvas.create_text(
-                x, y, text=script, font=('Arial', 9, 'bold'),
+                x, y, text=script, font=self.vis_font_chain,
                 tags=('draggable', 'text', group_tag)
             )
             
@@ -782,7 +1003,7 @@ class KSHAnalyzerGUI:
             
             # Create step label
             step_label = self.canvas.create_text(
-                x, y - box_height//2 - 20, text=f"Step {i+1}", font=('Arial', 8),
+                x, y - box_height//2 - 20, text=f"Step {i+1}", font=self.vis_font,
                 fill='darkred', tags=('step_label', group_tag)
             )
             elements[group_tag]['step_label'] = step_label
@@ -842,47 +1063,30 @@ class KSHAnalyzerGUI:
         center_y = script_elem['center_y']
         
         additional_elements = {}
+        # Membership is tested once per dependency, so hash the chain once
+        chain_members = set(chain)
         
         # Add forward dependencies (CTL and PL/SQL) below the chain
-        forward_non_script_deps = [dep for dep in forward_deps if dep['type'] in ['ctl', 'plsql'] or 
-                                  (dep['type'] == 'script' and dep['target'] not in chain)]
+        forward_non_script_deps = [dep for dep in forward_deps if dep['type'] in ('ctl', 'plsql') or 
+                                  (dep['type'] == 'script' and dep['target'] not in chain_members)]
         
         for i, dep in enumerate(forward_non_script_deps[:8]):  # Limit for visibility
             x = center_x + (i - len(forward_non_script_deps)//2) * 120  # Spread horizontally
             y = center_y + 120  # Below the main chain
             
             # Determine color and display text based on type
-            if dep['type'] == 'ctl':
-                color = 'lightyellow'
-                outline = 'orange'
-                display_text = dep['target']
-                icon = '📄'
-            elif dep['type'] == 'plsql':
-                color = 'lightcoral'
-                outline = 'darkred'
-                # Format PL/SQL procedure name
-                schema = dep.get('schema', '')
-                package = dep.get('package', '')
-                procedure = dep['target']
-                if schema and package:
-                    display_text = f"{schema}.{package}.{procedure}"
-                elif package:
-                    display_text = f"{package}.{procedure}"
-                else:
-                    display_text = procedure
+            color, outline, icon = self.dependency_styles[dep['type']]
+            if dep['type'] == 'plsql':
+                display_text = dep['full_procedure']
                 # Truncate if too long
                 if len(display_text) > 25:
                     display_text = display_text[:22] + "..."
-                icon = '⚡'
-            else:  # script not in chain
-                color = 'lightgreen'
-                outline = 'darkgreen'
+            else:  # CTL file or script not in chain
                 display_text = dep['target']
-                icon = '📜'
             
             # Calculate text dimensions
             full_text = f"{icon} {display_text}"
-            text_width, text_height = self.calculate_text_dimensions(full_text, ('Arial', 8))
+            text_width, text_height = self.calculate_text_dimensions(full_text, self.vis_font)
             box_width = max(text_width + 20, 100)
             box_height = max(text_height + 10, 30)
             
@@ -896,7 +1100,7 @@ class KSHAnalyzerGUI:
             )
             
             text = self.canvas.create_text(
-                x, y, text=full_text, font=('Arial', 8),
+                x, y, text=full_text, font=self.vis_font,
                 tags=('draggable', 'text', group_tag)
             )
             
@@ -931,7 +1135,7 @@ class KSHAnalyzerGUI:
             }
         
         # Add backward dependencies (scripts not in chain) above the chain
-        backward_non_script_deps = [dep for dep in backward_deps if dep['type'] == 'script' and dep['source'] not in chain]
+        backward_non_script_deps = [dep for dep in backward_deps if dep['type'] == 'script' and dep['source'] not in chain_members]
         
         for i, dep in enumerate(backward_non_script_deps[:5]):  # Limit for visibility
             x = center_x + (i - len(backward_non_script_deps)//2) * 120  # Spread horizontally
@@ -942,7 +1146,7 @@ class KSHAnalyzerGUI:
             display_text = f"📜 {dep['source']}"
             
             # Calculate text dimensions
-            text_width, text_height = self.calculate_text_dimensions(display_text, ('Arial', 8))
+            text_width, text_height = self.calculate_text_dimensions(display_text, self.vis_font)
             box_width = max(text_width + 20, 100)
             box_height = max(text_height + 10, 30)
             
@@ -956,7 +1160,7 @@ class KSHAnalyzerGUI:
             )
             
             text = self.canvas.create_text(
-                x, y, text=display_text, font=('Arial', 8),
+                x, y, text=display_text, font=self.vis_font,
                 tags=('draggable', 'text', group_tag)
             )
             
@@ -995,6 +1199,12 @@ class KSHAnalyzerGUI:
     
     def calculate_text_dimensions(self, text, font):
         """Calculate text dimensions for proper rectangle sizing"""
+        # Names recur across selections; each measurement costs three canvas calls
+        # Font objects are unhashable; their name identifies them
+        key = (text, str(font))
+        cached = self._text_dimensions.get(key)
+        if cached is not None:
+            return cached
         try:
             # Create a temporary text item to measure dimensions
             temp_text = self.canvas.create_text(0, 0, text=text, font=font)
@@ -1011,6 +1221,7 @@ class KSHAnalyzerGUI:
             # Clean up temporary text
             self.canvas.delete(temp_text)
             
+            self._text_dimensions[key] = (width, height)
             return width, height
         except:
             # Fallback dimensions if measurement fails
@@ -1022,7 +1233,7 @@ class KSHAnalyzerGUI:
         elements = {}
         
         # Calculate center script dimensions
-        center_text_width, center_text_height = self.calculate_text_dimensions(script_name, ('Arial', 10, 'bold'))
+        center_text_width, center_text_height = self.calculate_text_dimensions(script_name, self.vis_font_center)
         center_box_width = max(center_text_width + 20, 120)
         center_box_height = max(center_text_height + 10, 40)
         
@@ -1035,7 +1246,7 @@ class KSHAnalyzerGUI:
             tags=('draggable', 'rect', center_tag)
         )
         center_text = self.canvas.create_text(
-            center_x, center_y, text=script_name, font=('Arial', 10, 'bold'),
+            center_x, center_y, text=script_name, font=self.vis_font_center,
             tags=('draggable', 'text', center_tag)
         )
         
@@ -1057,34 +1268,18 @@ class KSHAnalyzerGUI:
             y = center_y + (i - 2) * 80  # Increased vertical spacing
             
             # Color and formatting based on type
-            if dep['type'] == 'script':
-                color = 'lightgreen'
-                outline = 'darkgreen'
-                display_text = f"📜 {dep['target']}"
-            elif dep['type'] == 'ctl':
-                color = 'lightyellow'
-                outline = 'orange'
-                display_text = f"📄 {dep['target']}"
-            else:  # plsql
-                color = 'lightcoral'
-                outline = 'darkred'
-                # Format PL/SQL procedure name
-                schema = dep.get('schema', '')
-                package = dep.get('package', '')
-                procedure = dep['target']
-                if schema and package:
-                    proc_name = f"{schema}.{package}.{procedure}"
-                elif package:
-                    proc_name = f"{package}.{procedure}"
-                else:
-                    proc_name = procedure
+            color, outline, icon = self.dependency_styles[dep['type']]
+            if dep['type'] == 'plsql':
+                name = dep['full_procedure']
                 # Truncate if too long
-                if len(proc_name) > 30:
-                    proc_name = proc_name[:27] + "..."
-                display_text = f"⚡ {proc_name}"
+                if len(name) > 30:
+                    name = name[:27] + "..."
+            else:
+                name = dep['target']
+            display_text = f"{icon} {name}"
             
             # Calculate text dimensions for auto-sizing
-            target_text_width, target_text_height = self.calculate_text_dimensions(display_text, ('Arial', 8))
+            target_text_width, target_text_height = self.calculate_text_dimensions(display_text, self.vis_font)
             target_box_width = max(target_text_width + 20, 100)
             target_box_height = max(target_text_height + 10, 30)
             
@@ -1099,7 +1294,7 @@ class KSHAnalyzerGUI:
             
             # Create draggable text with icon and formatting
             text = self.canvas.create_text(
-                x, y, text=display_text, font=('Arial', 8),
+                x, y, text=display_text, font=self.vis_font,
                 tags=('draggable', 'text', group_tag)
             )
             
@@ -1143,7 +1338,7 @@ class KSHAnalyzerGUI:
             display_text = f"📜 {source}"
             
             # Calculate text dimensions for auto-sizing
-            source_text_width, source_text_height = self.calculate_text_dimensions(display_text, ('Arial', 8))
+            source_text_width, source_text_height = self.calculate_text_dimensions(display_text, self.vis_font)
             source_box_width = max(source_text_width + 20, 100)
             source_box_height = max(source_text_height + 10, 30)
             
@@ -1158,7 +1353,7 @@ class KSHAnalyzerGUI:
             
             # Create draggable text with icon
             text = self.canvas.create_text(
-                x, y, text=display_text, font=('Arial', 8),
+                x, y, text=display_text, font=self.vis_font,
                 tags=('draggable', 'text', group_tag)
             )
             
@@ -1197,6 +1392,8 @@ class KSHAnalyzerGUI:
         
     def on_search(self, event=None):
         """Handle dynamic KSH script search functionality"""
+        # Return runs the search now; a keystroke timer still pending would repeat it
+        self._cancel_debounce('_script_search_timer')
         search_term = self.search_var.get().strip().lower()
         
         if not search_term:
@@ -1204,31 +1401,50 @@ class KSHAnalyzerGUI:
             self._restore_all_items()
             return
         
-        # Dynamic filtering with highlighting
-        matched_count = 0
+        # Dynamic filtering with highlighting; matching reads the stored
+        # snapshot, so no per-item Tcl calls are made while filtering
         all_items = self._get_all_tree_items()
         
-        # Store original structure for restoration
-        if not hasattr(self, '_original_tree_structure'):
-            self._store_original_tree_structure()
-        
-        # Clear current tree
-        for item in self.script_tree.get_children():
-            self.script_tree.delete(item)
+        # A term containing the previous one can only match a subset of its
+        # matches, so typing further only rechecks the last result
+        last_term, last_matches = self._last_script_search
+        if last_term is not None and last_term in search_term:
+            all_items = last_matches
+        matches = [item_data for item_data in all_items
+                   if self._item_matches_search(item_data, search_term)]
+        self._last_script_search = (search_term, matches)
         
-        # Rebuild tree with only matching items
-        for item_data in all_items:
-            if self._item_matches_search(item_data, search_term):
-                self._add_matching_item(item_data, search_term)
-                matched_count += 1
+        # Show only the matching rows
+        self._show_search_rows(matches, search_term)
         
         # Auto-select if single match
-        if matched_count == 1:
+        if len(matches) == 1:
             items = self.script_tree.get_children()
             if items:
                 self.script_tree.selection_set(items[0])
                 self.script_tree.focus(items[0])
             
+    def _delayed_script_search(self, event=None):
+        """Handle delayed script search for dynamic filtering"""
+        self._debounce('_script_search_timer', 200, self.on_search)
+    
+    def _debounce(self, timer_attr, delay, callback):
+        """Run callback once delay ms pass without another call for the same timer"""
+        self._cancel_debounce(timer_attr)
+        
+        def fire():
+            setattr(self, timer_attr, None)
+            callback()
+        
+        setattr(self, timer_attr, self.root.after(delay, fire))
+    
+    def _cancel_debounce(self, timer_attr):
+        """Drop the pending callback of a debounce timer, if any"""
+        timer = getattr(self, timer_attr)
+        if timer:
+            self.root.after_cancel(timer)
+            setattr(self, timer_attr, None)
+            
     def _show_tree_item(self, item):
         """Show tree item and its children"""
         self.script_tree.item(item, tags=())
@@ -1236,19 +1452,11 @@ class KSHAnalyzerGUI:
             self._show_tree_item(child)
             
     def _get_all_tree_items(self):
-        """Get all tree items with their data"""
-        if not hasattr(self, '_all_tree_items'):
-            self._all_tree_items = []
-            
-        # If we have stored items, return them
-        if self._all_tree_items:
-            return self._all_tree_items
-            
-        # Otherwise, collect from current tree
-        items = []
-        for item in self.script_tree.get_children():
-            items.extend(self._collect_item_data(item))
-        return items
+        """Get all tree items with their data, from the stored original structure"""
+        # Store original structure for restoration and later searches
+        if self._original_tree_structure is None:
+            self._store_original_tree_structure()
+        return self._original_tree_structure
     
     def _collect_item_data(self, item):
         """Recursively collect item data"""
@@ -1260,7 +1468,10 @@ class KSHAnalyzerGUI:
             'text': text,
             'values': values,
             'parent': None,
-            'children': []
+            'children': [],
+            # Lowercased once here rather than on every search keystroke
+            'search_text': f"{text} {' '.join(str(v) for v in values)}".lower(),
+            'highlight_text': text.lower()
         })
         
         # Collect children
@@ -1272,44 +1483,60 @@ class KSHAnalyzerGUI:
     
     def _store_original_tree_structure(self):
         """Store the original tree structure for restoration"""
+        self._populate_all_folders()
+        self._last_script_search = (None, [])
         self._original_tree_structure = []
         for item in self.script_tree.get_children():
             self._original_tree_structure.extend(self._collect_item_data(item))
     
     def _item_matches_search(self, item_data, search_term):
         """Check if item matches search term"""
-        text = item_data['text'].lower()
-        values_text = ' '.join(str(v).lower() for v in item_data['values'])
-        all_text = f"{text} {values_text}"
-        return search_term in all_text
-    
-    def _add_matching_item(self, item_data, search_term):
-        """Add matching item to tree with highlighting"""
-        text = item_data['text']
-        values = item_data['values']
-        
-        # Add item with highlighting if it contains search term
-        if search_term in text.lower():
-            tag = 'matched'
-        else:
-            tag = 'normal'
-            
-        self.script_tree.insert('', 'end', text=text, values=values, tags=(tag,))
+        return search_term in item_data['search_text']
+    
+    def _show_search_rows(self, rows, search_term=None):
+        """Show exactly these snapshot items as flat rows, highlighting those whose name contains search_term"""
+        tree = self.script_tree
+        if not self._search_view:
+            # First filter since the explorer was built: its folder rows go
+            tree.delete(*tree.get_children())
+            self._search_view = True
+        
+        # Each snapshot item gets its row once; later searches only retag it
+        # when its highlight changes and move it in or out of view
+        for item_data in rows:
+            tag = 'matched' if search_term and search_term in item_data['highlight_text'] else 'normal'
+            iid = item_data.get('iid')
+            if iid is None:
+                item_data['iid'] = tree.insert('', 'end', text=item_data['text'],
+                                               values=item_data['values'], tags=(tag,))
+            elif item_data['tag'] != tag:
+                tree.item(iid, tags=(tag,))
+            item_data['tag'] = tag
+        
+        # One call sets the visible rows and detaches the rest
+        tree.set_children('', *[item_data['iid'] for item_data in rows])
+    
+    def _clear_script_tree(self):
+        """Delete every explorer row, including search rows currently detached"""
+        rows = set(self.script_tree.get_children())
+        if self._original_tree_structure:
+            rows.update(item_data['iid'] for item_data in self._original_tree_structure
+                        if 'iid' in item_data)
+        if rows:
+            self.script_tree.delete(*rows)
+        self._search_view = False
     
     def _restore_all_items(self):
         """Restore all original items"""
-        # Clear current tree
-        for item in self.script_tree.get_children():
-            self.script_tree.delete(item)
+        # Nothing has been filtered since the explorer was last built
+        if self._original_tree_structure is None and self.script_tree.get_children():
+            return
         
         # Restore from original structure if available
-        if hasattr(self, '_original_tree_structure'):
-            for item_data in self._original_tree_structure:
-                self.script_tree.insert('', 'end', 
-                                      text=item_data['text'], 
-                                      values=item_data['values'], 
-                                      tags=('normal',))
+        if self._original_tree_structure is not None:
+            self._show_search_rows(self._original_tree_structure)
         else:
+            self._clear_script_tree()
             # Fallback: refresh the data
             if hasattr(self, 'analyzer') and self.ksh_dir.get():
                 self.scan_dependencies()
@@ -1358,8 +1585,8 @@ class KSHAnalyzerGUI:
                     obj_info['box_width'] *= scale_factor
                     obj_info['box_height'] *= scale_factor
         
-        # Update scroll region
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        # Re-measure once per step: canvas.scale moves text but keeps its size
+        self._update_scroll_region()
         
         # Update zoom label
         zoom_percent = int(self.zoom_factor * 100)
@@ -1422,8 +1649,8 @@ class KSHAnalyzerGUI:
                     obj_info['box_width'] *= scale_factor
                     obj_info['box_height'] *= scale_factor
         
-        # Update scroll region
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        # Re-measure once per step: canvas.scale moves text but keeps its size
+        self._update_scroll_region()
         
         # Update zoom label
         zoom_percent = int(self.zoom_factor * 100)
@@ -1434,7 +1661,7 @@ class KSHAnalyzerGUI:
         
     def fit_all(self):
         """Fit all items in visualization"""
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        self._update_scroll_region()
         
     def save_visualization(self):
         """Save visualization as image using built-in Python libraries"""
@@ -1677,11 +1904,11 @@ class KSHAnalyzerGUI:
         )
         
         if filename:
-            try:
-                self.analyzer.export_dependencies(filename)
-                messagebox.showinfo("Success", f"Dependencies exported to {filename}")
-            except Exception as e:
-                messagebox.showerror("Error", f"Export failed: {e}")
+            # The export runs on the database worker so the window keeps repainting
+            self._run_async(
+                lambda: self.analyzer.export_dependencies(filename),
+                lambda result: messagebox.showinfo("Success", f"Dependencies exported to {filename}"),
+                lambda error_msg: messagebox.showerror("Error", f"Export failed: {error_msg}"))
                 
     def refresh_view(self):
         """Refresh the current view"""
@@ -1691,14 +1918,13 @@ class KSHAnalyzerGUI:
     def clear_results(self):
         """Clear all results"""
         # Clear tree
-        for item in self.script_tree.get_children():
-            self.script_tree.delete(item)
+        self._clear_script_tree()
+        self._pending_children.clear()
+        self._original_tree_structure = None
             
         # Clear dependency views
-        for item in self.forward_tree.get_children():
-            self.forward_tree.delete(item)
-        for item in self.backward_tree.get_children():
-            self.backward_tree.delete(item)
+        self._clear_result_tree(self.forward_tree)
+        self._clear_result_tree(self.backward_tree)
             
         # Clear canvas and reset zoom
         self.canvas.delete("all")
@@ -1712,27 +1938,33 @@ class KSHAnalyzerGUI:
         self.status_label.config(text="Ready")
         self.selected_label.config(text="Selected: None")
         
+    def _open_db(self):
+        """The analyzer's shared connection for this thread (WAL, tuned cache); not closed here"""
+        return self.analyzer.get_connection()
+    
     def show_db_info(self):
         """Show database information"""
-        try:
-            conn = sqlite3.connect(self.analyzer.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute("SELECT COUNT(*) FROM scripts")
-            script_count = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(*) FROM dependencies")
-            dep_count = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(*) FROM ctl_files")
-            ctl_count = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(*) FROM plsql_calls")
-            plsql_count = cursor.fetchone()[0]
-            
-            conn.close()
-            
-            info_text = f"""Database Information:
+        self._run_async(
+            self._count_db_rows, self._show_db_counts,
+            lambda error_msg: messagebox.showerror("Error", f"Failed to get database info: {error_msg}"))
+    
+    def _count_db_rows(self):
+        """Row counts of the four tables (runs on the database worker)"""
+        cursor = self._open_db().cursor()
+        
+        # All four table counts in one statement
+        cursor.execute("""
+            SELECT (SELECT COUNT(*) FROM scripts),
+                   (SELECT COUNT(*) FROM dependencies),
+                   (SELECT COUNT(*) FROM ctl_files),
+                   (SELECT COUNT(*) FROM plsql_calls)
+        """)
+        return cursor.fetchone()
+    
+    def _show_db_counts(self, counts):
+        """Show the database information dialog"""
+        script_count, dep_count, ctl_count, plsql_count = counts
+        info_text = f"""Database Information:
             
 Scripts: {script_count}
 Dependencies: {dep_count}
@@ -1740,19 +1972,15 @@ CTL Files: {ctl_count}
 PL/SQL Calls: {plsql_count}
 
 Database File: {self.analyzer.db_path}"""
-            
-            messagebox.showinfo("Database Info", info_text)
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to get database info: {e}")
+        
+        messagebox.showinfo("Database Info", info_text)
             
     def on_plsql_search(self, event=None):
         """Handle PL/SQL procedure search"""
         search_term = self.plsql_search_var.get().strip()
         
         # Clear existing results
-        for item in self.plsql_results_tree.get_children():
-            self.plsql_results_tree.delete(item)
+        self.plsql_results_tree.delete(*self.plsql_results_tree.get_children())
             
         if not search_term:
             self.plsql_status_label.config(text="Enter search term to find PL/SQL procedures")
@@ -1772,7 +2000,7 @@ Database File: {self.analyzer.db_path}"""
                 
             # Display results
             for result in results:
-                status = "Commented" if result['is_commented'] else "Active"
+                status = self.call_status_labels[result['is_commented']]
                 schema = result['schema_name'] or ""
                 package = result['package_name'] or ""
                 
@@ -1788,20 +2016,20 @@ Database File: {self.analyzer.db_path}"""
             
     def _delayed_plsql_search(self, event=None):
         """Handle delayed PL/SQL search for dynamic filtering"""
-        # Cancel previous timer
-        if self._plsql_search_timer:
-            self.root.after_cancel(self._plsql_search_timer)
+        # Arrow keys, Shift and the like release without editing the term
+        if self.global_plsql_search_var.get().strip() == self._plsql_searched_term:
+            return
         
-        # Set new timer for 300ms delay
-        self._plsql_search_timer = self.root.after(300, self.on_global_plsql_search)
+        self._debounce('_plsql_search_timer', 300, self.on_global_plsql_search)
     
     def on_global_plsql_search(self, event=None):
         """Handle enhanced global PL/SQL procedure search with function-name-only capability"""
+        self._cancel_debounce('_plsql_search_timer')
         search_term = self.global_plsql_search_var.get().strip()
+        self._plsql_searched_term = search_term
         
         # Clear existing results
-        for item in self.global_plsql_results_tree.get_children():
-            self.global_plsql_results_tree.delete(item)
+        self._clear_result_tree(self.global_plsql_results_tree)
             
         if not search_term:
             self.global_plsql_status_label.config(text="Use PL/SQL search box above to find procedures across all scripts")
@@ -1810,56 +2038,59 @@ Database File: {self.analyzer.db_path}"""
         # Allow single character searches for more dynamic experience
         if len(search_term) < 1:
             return
-            
-        try:
-            # Enhanced search with function-name-only capability
+        
+        def search():
+            # Enhanced search with function-name-only capability; the rows
+            # are shaped here too, so the Tk thread only inserts them
             results = self.analyzer.search_plsql_procedure_enhanced(search_term)
-            
-            if not results:
-                self.global_plsql_status_label.config(text=f"No PL/SQL procedures found matching '{search_term}' across all scripts")
-                return
-                
-            # Display enhanced results
-            for result in results:
-                status = "Commented" if result['is_commented'] else "Active"
-                schema = result['schema_name'] or ""
-                package = result['package_name'] or ""
-                full_procedure = result['full_procedure']
-                match_quality = result.get('match_quality', 'unknown')
-                
-                # Enhanced format match quality for display including function-name matches
-                quality_display = {
-                    'exact_procedure': '🎯 Exact Procedure',
-                    'exact_function_name': '🎯 Exact Function',
-                    'partial_procedure': '📝 Partial Procedure',
-                    'partial_function_name': '📝 Partial Function',
-                    'package_match': '📦 Package',
-                    'schema_match': '🏢 Schema',
-                    'context_match': '📄 Context',
-                    'unknown': '❓ Unknown'
-                }.get(match_quality, match_quality)
-                
-                self.global_plsql_results_tree.insert('', 'end', 
-                                             text=result['source_script'],
-                                             values=(full_procedure, result['procedure_name'], schema, package, 
-                                                   result['line_number'], status, quality_display))
+            labels = self.match_quality_labels
+            statuses = self.call_status_labels
+            result_rows = [
+                (result['source_script'],
+                 (result['full_procedure'], result['procedure_name'],
+                  result['schema_name'], result['package_name'], result['line_number'],
+                  statuses[result['is_commented']],
+                  labels.get(result['match_quality'], result['match_quality'])))
+                for result in results
+            ]
             
             # Group results by script for summary
             scripts = set(result['source_script'] for result in results)
             procedures = set(result['full_procedure'] for result in results)
-            
-            self.global_plsql_status_label.config(text=f"Found {len(results)} calls to {len(procedures)} procedures across {len(scripts)} scripts")
-            
-        except Exception as e:
-            self.global_plsql_status_label.config(text=f"Search error: {e}")
+            return result_rows, len(procedures), len(scripts)
+        
+        # The query runs on the database worker so typing stays responsive
+        self._run_async(search,
+                        lambda found: self._show_plsql_results(search_term, *found),
+                        lambda error_msg: self._plsql_search_error(search_term, error_msg))
+    
+    def _show_plsql_results(self, search_term, result_rows, procedure_count, script_count):
+        """Display a finished PL/SQL search unless a newer search or a clear replaced it"""
+        if search_term != self._plsql_searched_term:
+            return
+        # The same term may have been searched again (Return) since the tree was cleared
+        self._clear_result_tree(self.global_plsql_results_tree)
+        
+        if not result_rows:
+            self.global_plsql_status_label.config(text=f"No PL/SQL procedures found matching '{search_term}' across all scripts")
+            return
+        
+        # Display enhanced results
+        self._fill_tree_paged(self.global_plsql_results_tree, result_rows)
+        self.global_plsql_status_label.config(text=f"Found {len(result_rows)} calls to {procedure_count} procedures across {script_count} scripts")
+    
+    def _plsql_search_error(self, search_term, error_msg):
+        """Report a failed PL/SQL search unless it has been superseded"""
+        if search_term == self._plsql_searched_term:
+            self.global_plsql_status_label.config(text=f"Search error: {error_msg}")
     
     def clear_global_plsql_search(self):
         """Clear global PL/SQL search results"""
         self.global_plsql_search_var.set("")
+        self._plsql_searched_term = ''
         
         # Clear results
-        for item in self.global_plsql_results_tree.get_children():
-            self.global_plsql_results_tree.delete(item)
+        self._clear_result_tree(self.global_plsql_results_tree)
             
         self.global_plsql_status_label.config(text="Use PL/SQL search box above to find procedures across all scripts")
     
@@ -1931,9 +2162,6 @@ Database File: {self.analyzer.db_path}"""
             # Update start position for next drag
             self.drag_start_x = canvas_x
             self.drag_start_y = canvas_y
-            
-            # Update scroll region
-            self.canvas.configure(scrollregion=self.canvas.bbox("all"))
     
     def update_connected_arrows(self, group_tag):
         """Update arrows connected to the moved element"""
@@ -2031,36 +2259,13 @@ Database File: {self.analyzer.db_path}"""
         if self.dragging:
             self.dragging = None
             self.canvas.config(cursor="")  # Reset cursor
+            
+            # Update scroll region once per drag rather than on every motion event
+            self._update_scroll_region()
 
     def show_about(self):
         """Show about dialog"""
-        about_text = """KSH Script Dependency Analyzer
-        
-Version: 1.2
-Author: Assistant
-        
-This application analyzes KSH/SH scripts to identify:
-- Script-to-script dependencies
-- CTL file references
-- PL/SQL procedure calls
-
-Features:
-- Bidirectional dependency mapping
-- Visual dependency graphs with improved dragging
-- Mouse wheel zoom and cursor-centered zooming
-- Image export (PostScript and text formats)
-- PL/SQL procedure search
-- Export functionality
-- Search and filter capabilities
-
-Controls:
-- Mouse wheel: Zoom in/out at cursor position
-- Drag: Move visualization elements
-- Ctrl+Plus/Minus: Zoom in/out
-- Ctrl+0: Reset zoom
-- Save Image: Export visualization to PostScript or text"""
-        
-        messagebox.showinfo("About", about_text)
+        messagebox.showinfo("About", _ABOUT_TEXT)
     
     def load_saved_paths(self):
         """Load saved directory paths on startup"""
@@ -2142,20 +2347,16 @@ Controls:
     def get_script_full_path(self, script_name, script_type):
         """Get the full path for a script"""
         try:
-            import sqlite3
-            conn = sqlite3.connect(self.analyzer.db_path)
-            cursor = conn.cursor()
+            cursor = self._open_db().cursor()
             
             if script_type == 'ksh' or script_type == 'sh':
                 cursor.execute('SELECT filepath FROM scripts WHERE filename = ?', (script_name,))
             elif script_type == 'ctl':
                 cursor.execute('SELECT filepath FROM ctl_files WHERE filename = ?', (script_name,))
             else:
-                conn.close()
                 return None
                 
             result = cursor.fetchone()
-            conn.close()
             
             return result[0] if result else None
             
@@ -2471,6 +2672,8 @@ Controls:
     
     def copy_script_path(self, script_name):
         """Copy script full path to clipboard"""
+        # Deferred folders hold only their placeholder until filled
+        self._populate_all_folders()
         item_values = None
         for item in self.script_tree.get_children():
             for child in self.script_tree.get_children(item):
@@ -2492,20 +2695,24 @@ Controls:
     
     def show_script_dependencies(self, script_name):
         """Show script dependencies (same as clicking on the script)"""
-        # Find and select the script in the tree
+        # Find and select the script in the tree, deferred folders included
+        self._populate_all_folders()
         for item in self.script_tree.get_children():
             for child in self.script_tree.get_children(item):
                 if self.script_tree.item(child, 'text') == script_name:
                     self.script_tree.selection_set(child)
                     self.current_script.set(script_name)
                     self.selected_label.config(text=f"Selected: {script_name}")
-                    self.update_dependency_views(script_name)
-                    self.update_visualization(script_name)
+                    forward_deps = self.analyzer.get_forward_dependencies(script_name)
+                    backward_deps = self.analyzer.get_backward_dependencies(script_name)
+                    self.update_dependency_views(script_name, forward_deps, backward_deps)
+                    self.update_visualization(script_name, forward_deps, backward_deps)
                     break
     
     def open_in_external_editor(self, script_name):
         """Open script in external editor"""
-        # Get script details
+        # Get script details; deferred folders hold only their placeholder until filled
+        self._populate_all_folders()
         item_values = None
         for item in self.script_tree.get_children():
             for child in self.script_tree.get_children(item):
@@ -2586,9 +2793,10 @@ Controls:
             
         item = selection[0]
         script_name = self.script_tree.item(item, 'text')
-        file_type = self.script_tree.item(item, 'values')[0]
+        item_values = self.script_tree.item(item, 'values')
+        file_type = item_values[0] if item_values else 'folder'
         
-        # Skip folder items
+        # Skip folder items (and the placeholder of a deferred folder)
         if script_name.startswith('📁') or file_type == 'folder':
             messagebox.showwarning("Invalid Selection", "Please select a KSH or CTL file, not a folder")
             return
@@ -2668,46 +2876,55 @@ Controls:
             if saved_ctl_dir:
                 self.ctl_dir.set(saved_ctl_dir)
             
-            # Check if we have existing data
-            if not self.has_existing_data():
-                self.progress.stop()
-                messagebox.showwarning(
-                    "No Data",
-                    "No existing data found in database. Please scan directories first."
-                )
-                return
-            
-            # Create mock results for display
-            scripts = self.analyzer.get_all_scripts()
-            ctl_files = self.analyzer.get_all_ctl_files()
-            
-            ksh_results = {
-                'total_files': len(scripts),
-                'dependencies': {}  # Not needed for display
-            }
-            
-            ctl_results = {
-                'total_files': len(ctl_files),
-                'ctl_files': ctl_files
-            }
-            
-            # Update GUI
-            self.update_script_tree(ksh_results, ctl_results)
-            
-            self.progress.stop()
-            self.status_label.config(text=f"Data loaded | Scripts: {len(scripts)} | CTL Files: {len(ctl_files)}")
-            
-            messagebox.showinfo(
-                "Data Loaded",
-                f"Successfully loaded existing data:\n"
-                f"Scripts: {len(scripts)}\n"
-                f"CTL Files: {len(ctl_files)}"
-            )
+            # The lists are queried once, in the background, and also fill the tree
+            self._run_async(self._load_script_lists, self._show_existing_data,
+                            self._existing_data_error)
             
         except Exception as e:
-            self.progress.stop()
-            self.status_label.config(text="Error loading data")
-            messagebox.showerror("Error", f"Failed to load existing data: {e}")
+            self._existing_data_error(str(e))
+    
+    def _show_existing_data(self, data):
+        """Fill the explorer from loaded lists and report what was loaded"""
+        scripts, ctl_files, dep_counts = data
+        self.progress.stop()
+        
+        # Check if we have existing data
+        if not scripts and not ctl_files:
+            self.status_label.config(text="Ready")
+            messagebox.showwarning(
+                "No Data",
+                "No existing data found in database. Please scan directories first."
+            )
+            return
+        
+        # Create mock results for display
+        ksh_results = {
+            'total_files': len(scripts),
+            'dependencies': {}  # Not needed for display
+        }
+        
+        ctl_results = {
+            'total_files': len(ctl_files),
+            'ctl_files': ctl_files
+        }
+        
+        # Update GUI
+        self._fill_script_tree(ksh_results, ctl_results, scripts, ctl_files, dep_counts)
+        
+        self.status_label.config(text=f"Data loaded | Scripts: {len(scripts)} | CTL Files: {len(ctl_files)}")
+        
+        messagebox.showinfo(
+            "Data Loaded",
+            f"Successfully loaded existing data:\n"
+            f"Scripts: {len(scripts)}\n"
+            f"CTL Files: {len(ctl_files)}"
+        )
+    
+    def _existing_data_error(self, error_msg):
+        """Handle errors while loading existing data"""
+        self.progress.stop()
+        self.status_label.config(text="Error loading data")
+        messagebox.showerror("Error", f"Failed to load existing data: {error_msg}")
 
 
 def main():
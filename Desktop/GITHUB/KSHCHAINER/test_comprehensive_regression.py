@@ -6,6 +6,7 @@ Tests all functionality to ensure no regressions after fixes
 
 import sys
 import os
+import tempfile
 sys.path.append('.')
 
 from ksh_analyzer import KSHAnalyzer
@@ -188,6 +189,18 @@ def test_comprehensive_regression():
     
     run_test("Job Controller", test_job_controller)
     
+    # Test 13: Aggregated Dependency Counts
+    def test_dependency_counts():
+        dep_counts = analyzer.get_dependency_counts()
+        
+        # Must agree with the per-script forward lookup the explorer used to run
+        for script in analyzer.get_all_scripts():
+            expected = len(analyzer.get_forward_dependencies(script))
+            actual = dep_counts.get(script, 0)
+            assert actual == expected, f"{script}: count {actual}, forward dependencies {expected}"
+    
+    run_test("Dependency Counts", test_dependency_counts)
+    
     # Print results
     print(f"\n{'='*60}")
     print(f"REGRESSION TEST RESULTS")
@@ -204,11 +217,116 @@ def test_comprehensive_regression():
         print(f"\n🎉 ALL TESTS PASSED! 🎉")
     
     # Clean up
+    analyzer.close()
     if os.path.exists("test_regression.db"):
         os.remove("test_regression.db")
     
     return test_results['failed_tests'] == 0
 
+def test_dependency_counts_match_forward_lookups():
+    """get_dependency_counts must agree with len(get_forward_dependencies()) per script"""
+    analyzer = KSHAnalyzer("test_dependency_counts.db")
+    try:
+        ksh_results = analyzer.analyze_ksh_directory("sample_data/ksh_scripts")
+        analyzer.analyze_ctl_directory("sample_data/ctl_files")
+        assert ksh_results['total_files'] >= 28, f"Expected at least 28 KSH files, got {ksh_results['total_files']}"
+        
+        dep_counts = analyzer.get_dependency_counts()
+        assert dep_counts, "Sample data should produce dependency counts"
+        
+        scripts = analyzer.get_all_scripts()
+        for script in scripts:
+            expected = len(analyzer.get_forward_dependencies(script))
+            actual = dep_counts.get(script, 0)
+            assert actual == expected, f"{script}: count {actual}, forward dependencies {expected}"
+        
+        # Every counted name is a calling script: it shows up as a source in backward lookups
+        for script, count in dep_counts.items():
+            assert count > 0, f"{script}: zero counts should be absent, got {count}"
+            assert script in scripts, f"{script} counted but not an analyzed script"
+        for script in scripts:
+            for dep in analyzer.get_backward_dependencies(script):
+                if dep['type'] == 'script':
+                    assert dep_counts.get(dep['source'], 0) > 0, f"{dep['source']} calls {script} but has no count"
+    finally:
+        analyzer.close()
+        if os.path.exists("test_dependency_counts.db"):
+            os.remove("test_dependency_counts.db")
+
+def test_parse_cache_reuse_and_invalidation():
+    """Unchanged files reuse their stored parse; edits, parser changes and deletions are picked up"""
+    with tempfile.TemporaryDirectory() as ksh_dir:
+        db_path = os.path.join(ksh_dir, "parse_cache.db")
+        caller = os.path.join(ksh_dir, "caller.ksh")
+        other = os.path.join(ksh_dir, "other.ksh")
+        with open(caller, "w") as f:
+            f.write("#!/bin/ksh\n./first_step.ksh\n")
+        with open(other, "w") as f:
+            f.write("#!/bin/ksh\necho done\n")
+        
+        analyzer = KSHAnalyzer(db_path)
+        # Record which files each scan actually parses
+        parsed = []
+        analyze_files = analyzer._analyze_files
+        def recording_analyze_files(files):
+            parsed.append(sorted(os.path.basename(path) for path in files))
+            return analyze_files(files)
+        analyzer._analyze_files = recording_analyze_files
+        
+        def targets():
+            return {dep['target'] for dep in analyzer.get_forward_dependencies("caller.ksh")}
+        
+        def cached_paths():
+            cursor = analyzer._get_connection().cursor()
+            cursor.execute("SELECT filepath FROM parse_cache")
+            return {os.path.basename(row[0]) for row in cursor}
+        
+        try:
+            # First scan parses everything and stores it
+            analyzer.analyze_ksh_directory(ksh_dir)
+            assert parsed[-1] == ["caller.ksh", "other.ksh"], parsed
+            assert targets() == {"first_step.ksh"}, targets()
+            assert cached_paths() == {"caller.ksh", "other.ksh"}
+            
+            # Nothing changed: the stored parses give the same dependencies
+            analyzer.analyze_ksh_directory(ksh_dir)
+            assert parsed[-1] == [], parsed
+            assert targets() == {"first_step.ksh"}, targets()
+            
+            # An edit changes size and mtime_ns, so only that file is parsed again
+            with open(caller, "w") as f:
+                f.write("#!/bin/ksh\n./second_step.ksh\n./third_step.ksh\n")
+            stat = os.stat(caller)
+            os.utime(caller, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            analyzer.analyze_ksh_directory(ksh_dir)
+            assert parsed[-1] == ["caller.ksh"], parsed
+            assert targets() == {"second_step.ksh", "third_step.ksh"}, targets()
+            
+            # Same size, new mtime_ns: parsed again as well
+            stat = os.stat(other)
+            os.utime(other, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            analyzer.analyze_ksh_directory(ksh_dir)
+            assert parsed[-1] == ["other.ksh"], parsed
+            
+            # A new parse_cache_version invalidates every stored parse
+            analyzer.parse_cache_version += 1
+            analyzer.analyze_ksh_directory(ksh_dir)
+            assert parsed[-1] == ["caller.ksh", "other.ksh"], parsed
+            assert targets() == {"second_step.ksh", "third_step.ksh"}, targets()
+            
+            # So do changed parsing patterns (the parser hash)
+            analyzer.patterns = dict(analyzer.patterns, cache_test=[r'unused_pattern'])
+            analyzer.analyze_ksh_directory(ksh_dir)
+            assert parsed[-1] == ["caller.ksh", "other.ksh"], parsed
+            
+            # Deleted files drop out of the cache
+            os.remove(other)
+            analyzer.analyze_ksh_directory(ksh_dir)
+            assert parsed[-1] == [], parsed
+            assert cached_paths() == {"caller.ksh"}, cached_paths()
+        finally:
+            analyzer.close()
+
 if __name__ == "__main__":
     success = test_comprehensive_regression()
     sys.exit(0 if success else 1)
\ No newline at end of file
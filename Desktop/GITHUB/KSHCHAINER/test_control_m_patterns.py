@@ -78,6 +78,7 @@ def test_control_m_patterns():
                 print(f"    ← {dep['source']} (line {dep['line']})")
     
     # Clean up
+    analyzer.close()
     if os.path.exists("test_control_m.db"):
         os.remove("test_control_m.db")
     
@@ -58,6 +58,7 @@ def test_analyzer_setup():
             print(f"    Scripts: {len(script_deps)}, CTL: {len(ctl_deps)}, PL/SQL: {len(plsql_deps)}")
     
     # Clean up
+    analyzer.close()
     if os.path.exists("test_gui_fixes.db"):
         os.remove("test_gui_fixes.db")
     
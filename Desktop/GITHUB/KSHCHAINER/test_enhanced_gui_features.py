@@ -196,6 +196,7 @@ def test_enhanced_gui_features():
         print(f"{scenario}: Should rescan = {should_scan}")
     
     # Clean up
+    analyzer.close()
     if os.path.exists(test_db):
         os.remove(test_db)
     
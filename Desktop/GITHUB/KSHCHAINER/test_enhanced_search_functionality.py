@@ -193,6 +193,7 @@ def test_enhanced_search_functionality():
             print(f"Search '{term}': Error - {e}")
     
     # Clean up
+    analyzer.close()
     if os.path.exists("test_search.db"):
         os.remove("test_search.db")
     
@@ -110,6 +110,7 @@ def test_image_export_capability():
     print(f"✓ Timestamp generation: {timestamp}")
     
     # Clean up
+    analyzer.close()
     if os.path.exists("test_export.db"):
         os.remove("test_export.db")
     
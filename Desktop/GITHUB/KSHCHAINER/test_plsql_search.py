@@ -4,8 +4,29 @@ Test script for PL/SQL procedure search functionality
 Tests the new search features and ensures regression is avoided
 """
 
+import os
+import tempfile
+
 from ksh_analyzer import KSHAnalyzer
 
+# Short, wildcard, quoted, case-varied and non-ASCII terms for the search index parity check
+PARITY_TERMS = [
+    '', 'a', 'cu', 'xyz_no_match', 'customer', 'CUSTOMER', 'CuStOmEr', 'validate',
+    'finance_pkg', 'finance%pkg', 'cust_mer', 'cust%', '%', '_', '100%', 'pkg.',
+    "o'brien", '"quoted"', 'cust"omer', 'ÄNALYTICS', 'straße', 'clé_client',
+    'process_transaction_data', 'job_mgmt',
+]
+
+class _NoSearchIndexAnalyzer(KSHAnalyzer):
+    """Analyzer behaving as if SQLite had no FTS5 trigram support"""
+    def _create_search_index(self, cursor):
+        return False
+
+def _search_results(analyzer, term):
+    """Both PL/SQL searches for term, fresh from the database"""
+    analyzer._invalidate_caches()
+    return analyzer.search_plsql_procedure(term), analyzer.search_plsql_procedure_enhanced(term)
+
 def test_plsql_search():
     """Test PL/SQL procedure search functionality"""
     print("=" * 70)
@@ -170,5 +191,46 @@ def test_plsql_search():
     print("✓ No regression in existing functionality")
     print("=" * 70)
 
+def test_search_index_parity():
+    """The trigram prefilter must return exactly the rows of the plain LIKE scan"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        analyzer = KSHAnalyzer(os.path.join(tmp_dir, "search_index.db"))
+        fallback = _NoSearchIndexAnalyzer(os.path.join(tmp_dir, "no_search_index.db"))
+        try:
+            for scan in range(2):
+                # The second scan checks the index rebuilt after the bulk load
+                analyzer.analyze_ksh_directory('sample_data/ksh_scripts')
+                fallback.analyze_ksh_directory('sample_data/ksh_scripts')
+                
+                assert analyzer._search_index, "SQLite here should provide the FTS5 trigram index"
+                assert analyzer._search_index_filter('customer')[0], "Long ASCII terms should use the index"
+                cursor = analyzer._get_connection().cursor()
+                cursor.execute("SELECT COUNT(*) FROM plsql_calls_fts")
+                indexed = cursor.fetchone()[0]
+                cursor.execute("SELECT COUNT(*) FROM plsql_calls")
+                assert indexed == cursor.fetchone()[0], f"Scan {scan + 1}: index out of step with plsql_calls"
+                
+                assert not fallback._search_index
+                assert fallback._search_index_filter('customer') == ('', ())
+                
+                for term in PARITY_TERMS:
+                    indexed_results = _search_results(analyzer, term)
+                    
+                    # Same database without the prefilter: the plain LIKE scan
+                    analyzer._search_index = False
+                    try:
+                        scanned_results = _search_results(analyzer, term)
+                    finally:
+                        analyzer._search_index = True
+                    
+                    assert indexed_results == scanned_results, f"Scan {scan + 1}: prefiltered results differ for {term!r}"
+                    assert _search_results(fallback, term) == scanned_results, f"Scan {scan + 1}: fallback results differ for {term!r}"
+            
+            assert _search_results(analyzer, 'customer')[0], "Sample data should contain customer procedures"
+        finally:
+            analyzer.close()
+            fallback.close()
+
 if __name__ == "__main__":
-    test_plsql_search()
\ No newline at end of file
+    test_plsql_search()
+    test_search_index_parity()
\ No newline at end of file
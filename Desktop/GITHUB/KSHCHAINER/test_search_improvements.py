@@ -190,6 +190,7 @@ def test_search_improvements():
         print(f"  '{term}': {len(ksh_matches)} KSH + {len(plsql_results)} PL/SQL in {duration_ms:.1f}ms")
     
     # Clean up
+    analyzer.close()
     if os.path.exists("test_improvements.db"):
         os.remove("test_improvements.db")
     